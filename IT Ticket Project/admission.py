@@ -0,0 +1,264 @@
+"""Admission control: shed load early instead of stalling on the SQLite lock.
+
+Every request passes two gates before it reaches Flask:
+
+1. A per-client token bucket (``RATE_LIMIT_PER_SECOND`` refill,
+   ``RATE_LIMIT_BURST`` capacity). An empty bucket answers **429** with a
+   ``Retry-After`` of the time until the next token.
+2. A concurrency limit per route class: ``read`` (GET/HEAD/OPTIONS) and
+   ``write`` (everything else, which needs the single SQLite write lock).
+   A full class lets up to ``ADMISSION_QUEUE_SIZE`` requests wait at most
+   ``ADMISSION_QUEUE_TIMEOUT`` seconds for a slot. Anyone beyond that, or who
+   times out, gets **503** with ``Retry-After: ADMISSION_RETRY_AFTER``.
+
+Rejections cost no database work, so an alert storm of creates degrades to
+fast 503s for the overflow while reads keep their own slots.
+
+Under ASGI the same limiters are awaited on the event loop
+(:meth:`ConcurrencyLimiter.acquire_async`), before any executor thread is
+used, and bridged WSGI requests are marked so the middleware doesn't gate
+them a second time.
+"""
+
+import asyncio
+import json
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Optional, Tuple
+
+# Set in the WSGI environ of a request that already passed admission (ASGI)
+ADMITTED_ENVIRON_KEY = "ticketing.admitted"
+
+READ_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+
+
+def route_class(method: str) -> str:
+    return "read" if method.upper() in READ_METHODS else "write"
+
+
+# -------------------------
+# Token bucket rate limiter
+# -------------------------
+class RateLimiter:
+    """Per-client token buckets, keeping at most ``max_clients`` of them."""
+
+    def __init__(
+        self, rate: float, burst: int, max_clients: int = 10000, clock=time.monotonic
+    ):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.max_clients = max_clients
+        self.clock = clock
+        # client -> (tokens, last refill); least recently seen first
+        self._buckets: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, client: str) -> float:
+        """Take a token for ``client``. Returns 0 if allowed, else seconds to wait."""
+        now = self.clock()
+        with self._lock:
+            tokens, last = self._buckets.pop(client, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            if tokens >= 1:
+                tokens -= 1
+                wait = 0.0
+            else:
+                wait = (1 - tokens) / self.rate
+            self._buckets[client] = (tokens, now)
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        return wait
+
+
+# -------------------------
+# Concurrency limiter
+# -------------------------
+class ConcurrencyLimiter:
+    """At most ``limit`` holders, at most ``queue_size`` waiters.
+
+    Waiters are threads (:meth:`acquire`) or coroutines (:meth:`acquire_async`).
+    A release hands its slot straight to the oldest coroutine waiter, if any.
+    """
+
+    def __init__(self, limit: int, queue_size: int, timeout: float):
+        self.limit = limit
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.active = 0
+        self.waiting = 0
+        self._cond = threading.Condition()
+        self._async_waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = (
+            deque()
+        )
+
+    def try_acquire(self) -> bool:
+        with self._cond:
+            if self.active < self.limit:
+                self.active += 1
+                return True
+            return False
+
+    def acquire(self) -> bool:
+        """Take a slot, queueing up to ``timeout`` seconds. False means rejected."""
+        with self._cond:
+            if self.active < self.limit:
+                self.active += 1
+                return True
+            if self.waiting >= self.queue_size or self.timeout <= 0:
+                return False
+            self.waiting += 1
+            try:
+                admitted = self._cond.wait_for(
+                    lambda: self.active < self.limit, self.timeout
+                )
+            finally:
+                self.waiting -= 1
+            if admitted:
+                self.active += 1
+            return admitted
+
+    async def acquire_async(self) -> bool:
+        """Like :meth:`acquire`, but waits on the event loop, not in a thread."""
+        loop = asyncio.get_running_loop()
+        with self._cond:
+            if self.active < self.limit:
+                self.active += 1
+                return True
+            if self.waiting >= self.queue_size or self.timeout <= 0:
+                return False
+            waiter = (loop, loop.create_future())
+            self._async_waiters.append(waiter)
+            self.waiting += 1
+        future = waiter[1]
+        try:
+            return await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            return False
+        except asyncio.CancelledError:
+            # Granted just before the cancellation landed: give the slot back
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+        finally:
+            with self._cond:
+                if waiter in self._async_waiters:
+                    self._async_waiters.remove(waiter)
+                    self.waiting -= 1
+
+    def release(self):
+        with self._cond:
+            if self._async_waiters:
+                # The slot stays taken and passes to the waiter
+                loop, future = self._async_waiters.popleft()
+                self.waiting -= 1
+                loop.call_soon_threadsafe(self._grant, future)
+                return
+            self.active -= 1
+            self._cond.notify()
+
+    def _grant(self, future: asyncio.Future):
+        if future.done():  # timed out or cancelled meanwhile
+            self.release()
+        else:
+            future.set_result(True)
+
+
+# -------------------------
+# Controller / WSGI middleware
+# -------------------------
+class AdmissionController:
+    def __init__(self, config):
+        queue_size = int(config.get("ADMISSION_QUEUE_SIZE", 32))
+        timeout = float(config.get("ADMISSION_QUEUE_TIMEOUT", 0.5))
+        self.limiters: Dict[str, ConcurrencyLimiter] = {
+            "read": ConcurrencyLimiter(
+                int(config.get("ADMISSION_READ_LIMIT", 16)), queue_size, timeout
+            ),
+            "write": ConcurrencyLimiter(
+                int(config.get("ADMISSION_WRITE_LIMIT", 2)), queue_size, timeout
+            ),
+        }
+        rate = float(config.get("RATE_LIMIT_PER_SECOND", 0))
+        self.rate_limiter: Optional[RateLimiter] = (
+            RateLimiter(rate, int(config.get("RATE_LIMIT_BURST", 20)))
+            if rate > 0
+            else None
+        )
+        self.retry_after = int(config.get("ADMISSION_RETRY_AFTER", 1))
+
+    def check_rate(self, client: str) -> Optional[int]:
+        """Retry-After seconds if ``client`` is over its rate, else None."""
+        if self.rate_limiter is None:
+            return None
+        wait = self.rate_limiter.acquire(client)
+        return max(math.ceil(wait), 1) if wait else None
+
+
+def rejection(status: int, retry_after: int, json_body: bool):
+    """Return (status line, headers, body) for a 429 / 503 rejection."""
+    if status == 429:
+        line, message = "429 Too Many Requests", "Too many requests, slow down."
+    else:
+        line, message = "503 Service Unavailable", "Server is busy, try again shortly."
+    if json_body:
+        body, content_type = (
+            json.dumps({"errors": [message]}).encode(),
+            "application/json",
+        )
+    else:
+        body, content_type = message.encode(), "text/plain; charset=utf-8"
+    headers = [
+        ("Content-Type", content_type),
+        ("Content-Length", str(len(body))),
+        ("Retry-After", str(retry_after)),
+    ]
+    return line, headers, body
+
+
+class AdmissionMiddleware:
+    """WSGI middleware applying an :class:`AdmissionController`."""
+
+    def __init__(self, wsgi_app, controller: AdmissionController):
+        self.wsgi_app = wsgi_app
+        self.controller = controller
+
+    def __call__(self, environ, start_response):
+        if environ.get(ADMITTED_ENVIRON_KEY):
+            return self.wsgi_app(environ, start_response)
+        json_body = environ.get("PATH_INFO", "").startswith("/api/")
+        retry_after = self.controller.check_rate(environ.get("REMOTE_ADDR") or "")
+        if retry_after is not None:
+            return self._reject(start_response, 429, retry_after, json_body)
+
+        limiter = self.controller.limiters[route_class(environ["REQUEST_METHOD"])]
+        if not limiter.acquire():
+            return self._reject(
+                start_response, 503, self.controller.retry_after, json_body
+            )
+        try:
+            result = self.wsgi_app(environ, start_response)
+            # Hold the slot until the body is produced, including template rendering
+            body = list(result)
+            if hasattr(result, "close"):
+                result.close()
+        finally:
+            limiter.release()
+        return body
+
+    @staticmethod
+    def _reject(start_response, status, retry_after, json_body):
+        line, headers, body = rejection(status, retry_after, json_body)
+        start_response(line, headers)
+        return [body]
+
+
+def init_admission(app) -> Optional[AdmissionController]:
+    """Install admission control on ``app`` when ``ADMISSION_ENABLED`` is set."""
+    if not app.config.get("ADMISSION_ENABLED"):
+        return None
+    controller = AdmissionController(app.config)
+    app.extensions["admission"] = controller
+    app.wsgi_app = AdmissionMiddleware(app.wsgi_app, controller)
+    return controller
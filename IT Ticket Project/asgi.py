@@ -0,0 +1,320 @@
+"""ASGI entry point for the ticketing app.
+
+Run with any ASGI server, e.g.::
+
+    uvicorn asgi:app --port 8000
+
+The event loop only parks connections; it never touches SQLite. JSON API
+routes under ``/api/tickets`` are served natively through the ``*_async``
+service variants, and every other request is bridged to the regular Flask
+WSGI app. Both paths run their blocking work on the same bounded DB executor
+(``DB_EXECUTOR_WORKERS`` threads), so idle or slow clients cost a coroutine
+rather than a worker thread.
+
+With admission control enabled (see admission.py) the native routes go
+through the same rate and concurrency gates as bridged requests.
+"""
+
+import asyncio
+import io
+import json
+import os
+import re
+import sys
+from functools import partial
+from typing import Optional
+from urllib.parse import parse_qs
+
+from admission import ADMITTED_ENVIRON_KEY, rejection, route_class
+from database import get_db_executor, shutdown_db_executor
+from services.ticket_service import (
+    claim_next_ticket_service_async,
+    count_tickets_service_async,
+    create_ticket_service_async,
+    get_ticket_service_async,
+    list_tickets_service_async,
+)
+from ticketing_app import create_app
+
+TICKET_PATH = re.compile(r"^/api/tickets/(\d+)$")
+
+
+class TicketASGI:
+    """Minimal ASGI 3 adapter around the Flask app."""
+
+    def __init__(self, flask_app):
+        self.flask_app = flask_app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            raise RuntimeError(f"Unsupported ASGI scope type: {scope['type']}")
+
+        body = await _read_body(receive)
+        with self.flask_app.app_context():
+            handler = self._route(scope, body, send)
+            if handler is None:
+                handler = partial(self._call_wsgi, scope, body, send)
+            await self._admitted(scope, handler, send)
+
+    def _route(self, scope, body, send):
+        """Handler for a native JSON route, or None to bridge to WSGI."""
+        path, method = scope["path"], scope["method"]
+        if path == "/api/tickets" and method == "GET":
+            return partial(self._list_tickets, scope, send)
+        if path == "/api/tickets" and method == "POST":
+            return partial(self._create_ticket, body, send)
+        if path == "/api/tickets/claim" and method == "POST":
+            return partial(self._claim_ticket, body, send)
+        match = TICKET_PATH.match(path)
+        if match and method == "GET":
+            return partial(self._get_ticket, int(match.group(1)), send)
+        return None
+
+    async def _admitted(self, scope, handler, send):
+        """Run ``handler`` behind the app's admission control, if any.
+
+        Bridged WSGI requests are gated here too, so a queued request waits on
+        the event loop rather than holding a DB executor thread.
+        """
+        controller = self.flask_app.extensions.get("admission")
+        if controller is None:
+            await handler()
+            return
+        json_body = scope["path"].startswith("/api/")
+        retry_after = controller.check_rate((scope.get("client") or ("", 0))[0])
+        if retry_after is not None:
+            await _send_rejection(send, 429, retry_after, json_body)
+            return
+        limiter = controller.limiters[route_class(scope["method"])]
+        if not await limiter.acquire_async():
+            await _send_rejection(send, 503, controller.retry_after, json_body)
+            return
+        try:
+            await handler()
+        finally:
+            limiter.release()
+
+    # -------------------------
+    # Lifespan
+    # -------------------------
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                get_db_executor(self.flask_app)
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                shutdown_db_executor(self.flask_app)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    # -------------------------
+    # Native async JSON routes
+    # -------------------------
+    async def _list_tickets(self, scope, send):
+        args = {k: v[-1] for k, v in parse_qs(scope["query_string"].decode()).items()}
+        try:
+            page = max(int(args.get("page", 1)), 1)
+            per_page = min(max(int(args.get("per_page", 10)), 1), 100)
+        except ValueError:
+            await _send_json(
+                send, 400, {"errors": ["page and per_page must be integers."]}
+            )
+            return
+        filters = {
+            "filter_status": args.get("filter_status"),
+            "search": args.get("search"),
+        }
+        tickets = await list_tickets_service_async(
+            sort_by=args.get("sort_by"),
+            sort_dir=args.get("sort_dir"),
+            page=page,
+            per_page=per_page,
+            **filters,
+        )
+        total = await count_tickets_service_async(**filters)
+        await _send_json(
+            send,
+            200,
+            {"tickets": [vars(t) for t in tickets], "total": total, "page": page},
+        )
+
+    async def _get_ticket(self, ticket_id, send):
+        ticket = await get_ticket_service_async(ticket_id)
+        if not ticket:
+            await _send_json(send, 404, {"errors": ["Ticket not found."]})
+            return
+        await _send_json(send, 200, vars(ticket))
+
+    async def _create_ticket(self, body, send):
+        data = _json_object(body)
+        if data is None:
+            await _send_json(
+                send, 400, {"errors": ["Request body must be a JSON object."]}
+            )
+            return
+        success, result = await create_ticket_service_async(
+            str(data.get("title", "")).strip(),
+            str(data.get("description", "")).strip(),
+            data.get("priority"),
+        )
+        if not success:
+            await _send_json(send, 400, {"errors": result})
+            return
+        await _send_json(send, 201, {"id": result})
+
+    async def _claim_ticket(self, body, send):
+        data = _json_object(body)
+        if data is None:
+            await _send_json(
+                send, 400, {"errors": ["Request body must be a JSON object."]}
+            )
+            return
+        success, result = await claim_next_ticket_service_async(
+            str(data.get("assignee", "")).strip(), data.get("lease_seconds")
+        )
+        if not success:
+            await _send_json(send, 400, {"errors": result})
+            return
+        if result is None:
+            await _send_json(send, 404, {"errors": ["No open tickets to claim."]})
+            return
+        await _send_json(send, 200, vars(result))
+
+    # -------------------------
+    # WSGI bridge
+    # -------------------------
+    async def _call_wsgi(self, scope, body, send):
+        environ = _build_environ(scope, body)
+        # Admission already ran in _admitted; the WSGI middleware must not
+        # block this executor thread on it again
+        environ[ADMITTED_ENVIRON_KEY] = True
+        loop = asyncio.get_running_loop()
+        status, headers, content = await loop.run_in_executor(
+            get_db_executor(self.flask_app), _run_wsgi, self.flask_app, environ
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (k.encode("latin1"), v.encode("latin1")) for k, v in headers
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": content})
+
+
+# -------------------------
+# Helpers
+# -------------------------
+async def _read_body(receive) -> bytes:
+    chunks = []
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunks.append(message.get("body", b""))
+        more_body = message.get("more_body", False)
+    return b"".join(chunks)
+
+
+def _json_object(body: bytes) -> Optional[dict]:
+    """Decode a JSON request body; None unless it is an object."""
+    try:
+        data = json.loads(body or b"{}")
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+async def _send_json(send, status, payload):
+    content = json.dumps(payload).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(content)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": content})
+
+
+async def _send_rejection(send, status, retry_after, json_body=True):
+    _, headers, content = rejection(status, retry_after, json_body)
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(k.lower().encode(), v.encode()) for k, v in headers],
+        }
+    )
+    await send({"type": "http.response.body", "body": content})
+
+
+def _build_environ(scope, body: bytes) -> dict:
+    server_name, server_port = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode().decode("latin1"),
+        "PATH_INFO": scope["path"].encode().decode("latin1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin1"),
+        "SERVER_NAME": server_name,
+        "SERVER_PORT": str(server_port),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "REMOTE_ADDR": client[0],
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+    for raw_name, raw_value in scope.get("headers", []):
+        name = raw_name.decode("latin1").upper().replace("-", "_")
+        value = raw_value.decode("latin1")
+        if name not in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+            name = f"HTTP_{name}"
+        environ[name] = f"{environ[name]},{value}" if name in environ else value
+    # The body is already buffered, so its length is known even for chunked uploads
+    environ["CONTENT_LENGTH"] = str(len(body))
+    return environ
+
+
+def _run_wsgi(wsgi_app, environ):
+    """Call a WSGI app to completion (runs on the DB executor)."""
+    response = {}
+
+    def start_response(status, headers, exc_info=None):
+        response["status"] = int(status.split(" ", 1)[0])
+        response["headers"] = headers
+
+    result = wsgi_app(environ, start_response)
+    try:
+        content = b"".join(result)
+    finally:
+        if hasattr(result, "close"):
+            result.close()
+    return response["status"], response["headers"], content
+
+
+app = TicketASGI(create_app())
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "asgi:app",
+        host=os.environ.get("HOST", "127.0.0.1"),
+        port=int(os.environ.get("PORT", "8000")),
+    )
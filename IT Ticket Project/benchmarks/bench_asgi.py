@@ -0,0 +1,196 @@
+"""Sync (threaded WSGI) vs async (ASGI) serving benchmark.
+
+Starts each server in a subprocess against the same seeded SQLite file, parks
+``--idle`` open-but-silent connections on it, then drives ``--requests`` GETs of
+the home page from ``--concurrency`` client threads. Reports throughput,
+latency and the server's thread count / RSS while the idle connections are
+held. Requires ``uvicorn`` for the async mode.
+
+Usage (from the ``IT Ticket Project`` directory)::
+
+    python -m benchmarks.bench_asgi --idle 500 --concurrency 16
+"""
+
+import argparse
+import http.client
+import os
+import socket
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from database import setup_db
+
+MODES = ("sync", "async")
+
+
+# -------------------------
+# Server side
+# -------------------------
+def serve(mode, db_path, port):
+    from ticketing_app import create_app
+
+    app = create_app({"DATABASE_PATH": db_path})
+    if mode == "sync":
+        import logging
+
+        from werkzeug.serving import make_server
+
+        logging.getLogger("werkzeug").setLevel(logging.WARNING)
+        make_server("127.0.0.1", port, app, threaded=True).serve_forever()
+    else:
+        import uvicorn
+        from asgi import TicketASGI
+
+        uvicorn.run(TicketASGI(app), host="127.0.0.1", port=port, log_level="warning")
+
+
+# -------------------------
+# Client side
+# -------------------------
+def seed(db_path, rows):
+    conn = sqlite3.connect(db_path)
+    setup_db(conn)
+    conn.executemany(
+        "INSERT INTO tickets (title, description, priority) VALUES (?, ?, ?)",
+        [
+            (f"Ticket {i}", f"Benchmark ticket number {i}", "Medium")
+            for i in range(rows)
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for_port(port, timeout=15.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def proc_stats(pid):
+    """Return (threads, rss_kb) from /proc, or (None, None) off Linux."""
+    try:
+        with open(f"/proc/{pid}/status") as fh:
+            fields = dict(line.split(":", 1) for line in fh if ":" in line)
+        return int(fields["Threads"]), int(fields["VmRSS"].split()[0])
+    except OSError:
+        return None, None
+
+
+def drive(port, total, concurrency):
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    per_thread = total // concurrency
+
+    def worker():
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        local = []
+        for _ in range(per_thread):
+            start = time.perf_counter()
+            try:
+                conn.request("GET", "/?sort_by=created_at")
+                resp = conn.getresponse()
+                resp.read()
+                if resp.status != 200:
+                    errors.append(resp.status)
+            except (OSError, http.client.HTTPException) as e:
+                errors.append(repr(e))
+                conn.close()
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+            local.append(time.perf_counter() - start)
+        conn.close()
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start, latencies, errors
+
+
+def bench(mode, db_path, args):
+    port = free_port()
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.bench_asgi",
+            "--serve",
+            mode,
+            "--db",
+            db_path,
+            "--port",
+            str(port),
+        ],
+    )
+    idle = []
+    try:
+        wait_for_port(port)
+        idle = [socket.create_connection(("127.0.0.1", port)) for _ in range(args.idle)]
+        time.sleep(0.5)
+        threads, rss_kb = proc_stats(proc.pid)
+        elapsed, latencies, errors = drive(port, args.requests, args.concurrency)
+    finally:
+        for s in idle:
+            s.close()
+        proc.terminate()
+        proc.wait(timeout=10)
+
+    latencies.sort()
+    print(f"[{mode}] idle={args.idle} concurrency={args.concurrency}")
+    print(f"  server threads     {threads}")
+    print(f"  server RSS         {rss_kb} kB")
+    print(f"  throughput         {len(latencies) / elapsed:,.0f} req/s")
+    print(f"  latency mean       {statistics.mean(latencies) * 1000:.2f} ms")
+    print(
+        f"  latency p95        {latencies[int(len(latencies) * 0.95) - 1] * 1000:.2f} ms"
+    )
+    print(f"  errors             {len(errors)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=MODES, action="append")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--idle", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    # internal: run a server instead of the benchmark
+    parser.add_argument("--serve", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--db", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        serve(args.serve, args.db, args.port)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        seed(db_path, args.rows)
+        for mode in args.mode or MODES:
+            bench(mode, db_path, args)
+
+
+if __name__ == "__main__":
+    main()
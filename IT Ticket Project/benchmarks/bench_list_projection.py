@@ -0,0 +1,102 @@
+"""List-page projection benchmark.
+
+Compares the old ``SELECT *`` list query with the current narrow projection
+(``models.ticket.LIST_COLUMNS``) on a dataset with long descriptions, and
+reports bytes materialized into Python and time per page.
+
+Usage (from the ``IT Ticket Project`` directory)::
+
+    python -m benchmarks.bench_list_projection --rows 20000 --description-size 8192
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+from types import SimpleNamespace
+
+from database import PRIORITIES, STATUSES, setup_db
+from models.ticket import list_tickets
+
+PAGE_SIZE = 10
+
+
+def legacy_list_tickets(conn, offset, limit):
+    """The pre-projection list query, kept here only for comparison."""
+    rows = conn.execute(
+        "SELECT * FROM tickets ORDER BY id LIMIT ? OFFSET ?", (limit, offset)
+    ).fetchall()
+    return [SimpleNamespace(**dict(r)) for r in rows]
+
+
+def page_bytes(tickets):
+    return sum(
+        len(v.encode()) if isinstance(v, str) else 8
+        for t in tickets
+        for v in vars(t).values()
+    )
+
+
+def seed(conn, rows, description_size):
+    body = ("Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 200)[
+        :description_size
+    ]
+    conn.executemany(
+        "INSERT INTO tickets (title, description, priority, status) VALUES (?, ?, ?, ?)",
+        [
+            (f"Ticket {i}", body, PRIORITIES[i % 3], STATUSES[i % 3])
+            for i in range(rows)
+        ],
+    )
+    conn.commit()
+
+
+def measure(label, fetch, pages, repeat):
+    start = time.perf_counter()
+    total_bytes = 0
+    for _ in range(repeat):
+        for page in range(pages):
+            total_bytes += page_bytes(fetch(page * PAGE_SIZE))
+    elapsed = time.perf_counter() - start
+    n = pages * repeat
+    print(
+        f"  {label:<12} {total_bytes / n:>10,.0f} bytes/page"
+        f"  {elapsed / n * 1e6:>9,.1f} us/page"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--description-size", type=int, default=4096)
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(os.path.join(tmp, "bench.db"))
+        conn.row_factory = sqlite3.Row
+        setup_db(conn)
+        seed(conn, args.rows, args.description_size)
+        print(
+            f"rows={args.rows} description={args.description_size} chars "
+            f"page_size={PAGE_SIZE}"
+        )
+        measure(
+            "select *",
+            lambda offset: legacy_list_tickets(conn, offset, PAGE_SIZE),
+            args.pages,
+            args.repeat,
+        )
+        measure(
+            "projection",
+            lambda offset: list_tickets(conn, offset=offset, limit=PAGE_SIZE),
+            args.pages,
+            args.repeat,
+        )
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
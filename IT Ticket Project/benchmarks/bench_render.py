@@ -0,0 +1,106 @@
+"""Home page render benchmark: row fragment cache and Jinja bytecode cache.
+
+Renders ``home.html`` with 100 ticket rows and reports time per render with
+the fragment cache disabled, cold (cleared before every render) and warm.
+It then measures a fresh worker's first render without a bytecode cache,
+with an empty one, and with a populated one.
+
+Usage (from the ``IT Ticket Project`` directory)::
+
+    python -m benchmarks.bench_render --repeat 200
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.loadtest import seed_database
+from database import STATUSES
+from flask import render_template
+from services.ticket_service import list_tickets_service
+from ticketing_app import create_app
+
+ROWS_PER_PAGE = 100
+
+
+def render_home(app, tickets):
+    with app.test_request_context("/"):
+        return render_template(
+            "home.html",
+            tickets=tickets,
+            current_page=1,
+            total_pages=1,
+            search="",
+            filter_status=None,
+            sort_by=None,
+            sort_dir=None,
+            STATUSES=STATUSES,
+        )
+
+
+def make_app(db_path, **config):
+    return create_app({"DATABASE_PATH": db_path, **config})
+
+
+def fetch_page(app):
+    with app.app_context():
+        return list_tickets_service(sort_by="created_at", per_page=ROWS_PER_PAGE)
+
+
+def measure_rows(label, app, tickets, repeat, clear=False):
+    cache = app.extensions["fragment_cache"]
+    render_home(app, tickets)  # compile the templates outside the timing
+    elapsed = 0.0
+    for _ in range(repeat):
+        if clear:
+            cache.clear()
+        start = time.perf_counter()
+        render_home(app, tickets)
+        elapsed += time.perf_counter() - start
+    print(f"  {label:<22} {elapsed / repeat * 1000:8.3f} ms / {ROWS_PER_PAGE} rows")
+
+
+def measure_first_render(label, db_path, tickets, **config):
+    app = make_app(db_path, **config)
+    start = time.perf_counter()
+    render_home(app, tickets)
+    print(f"  {label:<22} {(time.perf_counter() - start) * 1000:8.3f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000, help="tickets to seed")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        seed_database(db_path, args.rows)
+        tickets = fetch_page(make_app(db_path))
+
+        print("Row rendering:")
+        measure_rows(
+            "no fragment cache",
+            make_app(db_path, FRAGMENT_CACHE_SIZE=0),
+            tickets,
+            args.repeat,
+        )
+        app = make_app(db_path)
+        measure_rows("fragment cache, cold", app, tickets, args.repeat, clear=True)
+        measure_rows("fragment cache, warm", app, tickets, args.repeat)
+
+        print("First render in a fresh worker:")
+        bytecode_dir = os.path.join(tmp, "jinja")
+        os.makedirs(bytecode_dir)
+        measure_first_render("no bytecode cache", db_path, tickets)
+        cached = {
+            "JINJA_BYTECODE_CACHE": True,
+            "JINJA_BYTECODE_CACHE_DIR": bytecode_dir,
+        }
+        measure_first_render("bytecode cache, cold", db_path, tickets, **cached)
+        measure_first_render("bytecode cache, warm", db_path, tickets, **cached)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Storage backend micro-benchmark.
+
+Runs the same workload against every backend and prints ops/sec per operation.
+
+Usage (from the ``IT Ticket Project`` directory)::
+
+    python -m benchmarks.bench_storage --rows 20000
+"""
+
+import argparse
+import random
+import sqlite3
+import time
+
+from database import PRIORITIES, STATUSES, setup_db
+from storage.memory_backend import MemoryBackend
+from storage.sqlite_backend import SQLiteBackend
+
+WORDS = ["server", "printer", "vpn", "email", "laptop", "network", "disk", "login"]
+
+
+def make_sqlite_backend():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    setup_db(conn)
+    return SQLiteBackend(conn)
+
+
+BACKENDS = {"sqlite": make_sqlite_backend, "memory": MemoryBackend}
+
+
+def _timed(label, n, fn):
+    start = time.perf_counter()
+    for i in range(n):
+        fn(i)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {n / elapsed:>12,.0f} ops/s")
+
+
+def run(backend, rows, queries, seed=0):
+    rng = random.Random(seed)
+
+    def create(_):
+        w = rng.choice(WORDS)
+        backend.create_ticket(
+            f"{w} issue", f"The {w} is broken again", rng.choice(PRIORITIES)
+        )
+
+    def update(_):
+        tid = rng.randint(1, rows)
+        backend.update_ticket(
+            tid,
+            "edited",
+            "edited description",
+            rng.choice(PRIORITIES),
+            rng.choice(STATUSES),
+        )
+
+    _timed("create", rows, create)
+    _timed("update", queries, update)
+    _timed("get", queries, lambda _: backend.get_ticket(rng.randint(1, rows)))
+    _timed("list (page 1)", queries, lambda _: backend.list_tickets())
+    _timed(
+        "list filter+sort priority",
+        queries,
+        lambda _: backend.list_tickets(filter_status="Open", sort_by="priority"),
+    )
+    _timed(
+        "list sort created_at p10",
+        queries,
+        lambda _: backend.list_tickets(sort_by="created_at", offset=90),
+    )
+    _timed(
+        "count filter", queries, lambda _: backend.count_tickets(filter_status="Open")
+    )
+    _timed(
+        "list search",
+        max(queries // 10, 1),
+        lambda _: backend.list_tickets(search=rng.choice(WORDS)),
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--backend", choices=sorted(BACKENDS), action="append")
+    args = parser.parse_args(argv)
+
+    for name in args.backend or sorted(BACKENDS):
+        print(f"[{name}] rows={args.rows} queries={args.queries}")
+        backend = BACKENDS[name]()
+        try:
+            run(backend, args.rows, args.queries)
+        finally:
+            backend.close()
+
+
+if __name__ == "__main__":
+    main()
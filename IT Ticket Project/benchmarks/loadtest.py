@@ -0,0 +1,302 @@
+"""HTTP load generator for the full ticketing stack.
+
+Starts the app from ``ticketing_app.create_app`` on a seeded SQLite database,
+drives a weighted mix of ``home`` (random search / filter / sort / page),
+``create``, ``update`` and ``delete`` requests from many client threads, and
+prints a JSON report with throughput, p50/p95/p99 latency and error rates per
+route so releases can be compared.
+
+The HTML routes report most failures with a flash message rather than an error
+status, so a request only counts as successful when it got the status its
+route answers on success (200 for ``home``, a 302 redirect for the writes) and
+no ``danger`` flash in its session cookie.
+
+Usage (from the ``IT Ticket Project`` directory)::
+
+    python -m benchmarks.loadtest --duration 30 --clients 16 \\
+        --mix home=70,create=10,update=15,delete=5 --output load.json
+"""
+
+import argparse
+import base64
+import http.client
+import json
+import logging
+import math
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional
+from urllib.parse import urlencode
+
+from database import PRIORITIES, STATUSES, setup_db
+
+ROUTES = ("home", "create", "update", "delete")
+DEFAULT_MIX = "home=70,create=10,update=15,delete=5"
+WORDS = ["server", "printer", "vpn", "email", "laptop", "network", "disk", "login"]
+FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+# Status each route answers with on success
+SUCCESS_STATUS = {"home": 200, "create": 302, "update": 302, "delete": 302}
+
+
+def parse_mix(spec: str) -> Dict[str, int]:
+    """Parse ``route=weight,...`` into a dict, rejecting unknown routes."""
+    mix = {}
+    for part in spec.split(","):
+        route, _, weight = part.partition("=")
+        route = route.strip()
+        if route not in ROUTES:
+            raise ValueError(f"Unknown route in mix: {route!r}")
+        mix[route] = int(weight)
+    if not any(mix.values()):
+        raise ValueError("Mix must give at least one route a positive weight")
+    return mix
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100.0 * len(sorted_values)), 1)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def seed_database(db_path: str, rows: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    conn = sqlite3.connect(db_path)
+    setup_db(conn)
+    conn.executemany(
+        "INSERT INTO tickets (title, description, priority, status) VALUES (?, ?, ?, ?)",
+        [
+            (
+                f"{rng.choice(WORDS)} issue {i}",
+                f"The {rng.choice(WORDS)} is broken for user {i}",
+                rng.choice(PRIORITIES),
+                rng.choice(STATUSES),
+            )
+            for i in range(rows)
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+
+# -------------------------
+# Request generators
+# -------------------------
+def _ticket_form(rng, status=None):
+    word = rng.choice(WORDS)
+    form = {
+        "title": f"{word} load test",
+        "description": f"Generated by the load test for {word}",
+        "priority": rng.choice(PRIORITIES),
+    }
+    if status:
+        form["status"] = status
+    return form
+
+
+def build_request(route: str, rng: random.Random, max_id: int):
+    """Return (method, path, body) for one request of the given route."""
+    if route == "home":
+        args = {"page": rng.randint(1, 5)}
+        if rng.random() < 0.3:
+            args["search"] = rng.choice(WORDS)
+        if rng.random() < 0.5:
+            args["filter_status"] = rng.choice(STATUSES)
+        if rng.random() < 0.5:
+            args["sort_by"] = rng.choice(["priority", "created_at"])
+        return "GET", "/?" + urlencode(args), None
+    if route == "create":
+        return "POST", "/create", urlencode(_ticket_form(rng))
+    ticket_id = rng.randint(1, max(max_id, 1))
+    if route == "update":
+        body = urlencode(_ticket_form(rng, status=rng.choice(STATUSES)))
+        return "POST", f"/update/{ticket_id}", body
+    return "POST", f"/delete/{ticket_id}", None
+
+
+# -------------------------
+# Load driver
+# -------------------------
+def flashed_danger(set_cookie: Optional[str]) -> bool:
+    """True if a Flask session cookie carries a ``danger`` flash.
+
+    The payload of the signed cookie is readable without the secret key:
+    base64 JSON, zlib-compressed when it starts with ``.``.
+    """
+    if not set_cookie or not set_cookie.startswith("session="):
+        return False
+    value = set_cookie[len("session=") :].split(";", 1)[0]
+    compressed = value.startswith(".")
+    payload = value.lstrip(".").split(".", 1)[0]
+    try:
+        data = base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        if compressed:
+            data = zlib.decompress(data)
+    except (ValueError, zlib.error):
+        return False
+    return b'"danger"' in data
+
+
+def request_failed(route: str, resp) -> bool:
+    return resp.status != SUCCESS_STATUS[route] or flashed_danger(
+        resp.getheader("Set-Cookie")
+    )
+
+
+def _client(host, port, mix, deadline, max_id, seed, results, lock):
+    rng = random.Random(seed)
+    routes, weights = zip(*mix.items())
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    local = {route: {"latencies": [], "errors": 0} for route in routes}
+    while time.monotonic() < deadline:
+        route = rng.choices(routes, weights)[0]
+        method, path, body = build_request(route, rng, max_id)
+        start = time.perf_counter()
+        try:
+            conn.request(method, path, body=body, headers=FORM_HEADERS if body else {})
+            resp = conn.getresponse()
+            resp.read()
+            failed = request_failed(route, resp)
+        except (OSError, http.client.HTTPException):
+            failed = True
+            conn.close()
+            conn = http.client.HTTPConnection(host, port, timeout=30)
+        local[route]["latencies"].append(time.perf_counter() - start)
+        local[route]["errors"] += failed
+    conn.close()
+    with lock:
+        for route, stats in local.items():
+            results[route]["latencies"].extend(stats["latencies"])
+            results[route]["errors"] += stats["errors"]
+
+
+def _summarize(latencies: List[float], errors: int, elapsed: float) -> dict:
+    latencies = sorted(latencies)
+    count = len(latencies)
+    ms = [v * 1000 for v in latencies]
+    return {
+        "requests": count,
+        "errors": errors,
+        "error_rate": errors / count if count else 0.0,
+        "throughput_rps": count / elapsed if elapsed else 0.0,
+        "latency_ms": {
+            "mean": sum(ms) / count if count else 0.0,
+            "p50": percentile(ms, 50),
+            "p95": percentile(ms, 95),
+            "p99": percentile(ms, 99),
+            "max": ms[-1] if ms else 0.0,
+        },
+    }
+
+
+def run_load(
+    host: str,
+    port: int,
+    mix: Dict[str, int],
+    clients: int,
+    duration: float,
+    max_id: int,
+    seed: int = 0,
+) -> dict:
+    """Drive the server at host:port and return the JSON-ready report."""
+    mix = {route: weight for route, weight in mix.items() if weight > 0}
+    results = {route: {"latencies": [], "errors": 0} for route in mix}
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+    threads = [
+        threading.Thread(
+            target=_client,
+            args=(host, port, mix, deadline, max_id, seed + i, results, lock),
+        )
+        for i in range(clients)
+    ]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    all_latencies = [v for r in results.values() for v in r["latencies"]]
+    all_errors = sum(r["errors"] for r in results.values())
+    return {
+        "config": {
+            "mix": mix,
+            "clients": clients,
+            "duration_s": duration,
+            "seed": seed,
+        },
+        "elapsed_s": elapsed,
+        "total": _summarize(all_latencies, all_errors, elapsed),
+        "routes": {
+            route: _summarize(r["latencies"], r["errors"], elapsed)
+            for route, r in results.items()
+        },
+    }
+
+
+def start_server(app):
+    """Serve ``app`` on a free local port from a daemon thread."""
+    from werkzeug.serving import make_server
+
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main(argv: Optional[List[str]] = None) -> dict:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="route=weight,...")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--rows", type=int, default=5000, help="tickets to seed")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--db", help="existing database to use instead of seeding")
+    parser.add_argument("--output", help="write the JSON report here (default: stdout)")
+    args = parser.parse_args(argv)
+    mix = parse_mix(args.mix)
+
+    from ticketing_app import create_app
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = args.db
+        if not db_path:
+            db_path = os.path.join(tmp, "loadtest.db")
+            seed_database(db_path, args.rows, args.seed)
+        conn = sqlite3.connect(db_path)
+        max_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM tickets").fetchone()[0]
+        conn.close()
+
+        server = start_server(create_app({"DATABASE_PATH": db_path}))
+        try:
+            report = run_load(
+                "127.0.0.1",
+                server.server_port,
+                mix,
+                args.clients,
+                args.duration,
+                max_id,
+                args.seed,
+            )
+        finally:
+            server.shutdown()
+
+    report["config"].update(rows=args.rows if not args.db else None, db=args.db)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(text + "\n")
+    else:
+        print(text)
+    return report
+
+
+if __name__ == "__main__":
+    main()
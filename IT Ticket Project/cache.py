@@ -0,0 +1,75 @@
+"""Process-local caches kept coherent across worker processes.
+
+Every change to ``tickets`` bumps ``ticket_generation`` inside the writing
+transaction (see ``database.ensure_generation``). A request reads that counter
+once, a primary-key lookup, and each :class:`GenerationCache` drops all of its
+entries when the counter has moved since they were stored. No message broker
+is needed. A write made by any worker, or by a script, invalidates every
+worker's caches on its next request.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from database import db_session
+from flask import current_app, g
+
+
+def current_generation() -> int:
+    """The storage generation, read at most once per request."""
+    if "ticket_generation" not in g:
+        with db_session() as backend:
+            g.ticket_generation = backend.generation()
+    return g.ticket_generation
+
+
+def forget_generation() -> None:
+    """Make the next ``current_generation`` re-read (after a write)."""
+    g.pop("ticket_generation", None)
+
+
+class GenerationCache:
+    """Bounded LRU cache whose entries are valid for a single generation."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._generation: Optional[int] = None
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _sync(self, generation: int) -> None:
+        if generation != self._generation:
+            self._data.clear()
+            self._generation = generation
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        generation = current_generation()
+        with self._lock:
+            self._sync(generation)
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+        # Computed after the generation was read, so the value is never older
+        # than the generation it is stored under.
+        value = compute()
+        with self._lock:
+            if self._generation == generation:
+                self._data[key] = value
+                if len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+        return value
+
+
+def get_cache(name: str) -> GenerationCache:
+    """Return the current app's named cache, creating it on first use."""
+    caches = current_app.extensions.setdefault("generation_caches", {})
+    cache = caches.get(name)
+    if cache is None:
+        size = current_app.config.get("GENERATION_CACHE_SIZE", 256)
+        cache = caches.setdefault(name, GenerationCache(size))
+    return cache
@@ -4,3 +4,76 @@ import os
 # the SECRET_KEY environment variable to a secure random value.
 SECRET_KEY = os.environ.get("SECRET_KEY", "supersecretkey")
 DATABASE_PATH = os.environ.get("DATABASE_PATH", "tickets.db")
+# Storage backend: "sqlite" (durable, default) or "memory" (ephemeral).
+STORAGE_BACKEND = os.environ.get("STORAGE_BACKEND", "sqlite")
+# Worker threads used by the async (ASGI) mode to run blocking DB calls.
+DB_EXECUTOR_WORKERS = int(os.environ.get("DB_EXECUTOR_WORKERS", "8"))
+# Seconds a connection waits for the SQLite write lock before "database is locked".
+DB_BUSY_TIMEOUT = float(os.environ.get("DB_BUSY_TIMEOUT", "5"))
+# Entries per process-local cache (see cache.py); invalidated by any ticket write.
+GENERATION_CACHE_SIZE = int(os.environ.get("GENERATION_CACHE_SIZE", "256"))
+# How long a claimed ticket stays with its assignee before returning to the queue.
+CLAIM_LEASE_SECONDS = int(os.environ.get("CLAIM_LEASE_SECONDS", "900"))
+
+# SLA escalation (see sla.py): seconds a ticket may stay Open / In Progress,
+# per priority, before it is escalated. The scheduler is off unless set to "1".
+SLA_SCHEDULER_ENABLED = os.environ.get("SLA_SCHEDULER_ENABLED", "0") == "1"
+SLA_SECONDS = {
+    "High": int(os.environ.get("SLA_SECONDS_HIGH", str(4 * 3600))),
+    "Medium": int(os.environ.get("SLA_SECONDS_MEDIUM", str(24 * 3600))),
+    "Low": int(os.environ.get("SLA_SECONDS_LOW", str(72 * 3600))),
+}
+
+# Number of typeahead suggestions returned by /suggest (max 20).
+SUGGEST_LIMIT = int(os.environ.get("SUGGEST_LIMIT", "8"))
+
+# Rendered ticket rows kept per process (see fragments.py); 0 disables.
+FRAGMENT_CACHE_SIZE = int(os.environ.get("FRAGMENT_CACHE_SIZE", "2048"))
+# Keep compiled templates on disk so fresh workers skip compiling them.
+# Off unless "1"; the directory defaults to <instance path>/jinja_cache.
+JINJA_BYTECODE_CACHE = os.environ.get("JINJA_BYTECODE_CACHE", "0") == "1"
+JINJA_BYTECODE_CACHE_DIR = os.environ.get("JINJA_BYTECODE_CACHE_DIR", "")
+# Strong ETags / gzip for page responses (see http_cache.py). Off unless "1".
+RESPONSE_ETAGS = os.environ.get("RESPONSE_ETAGS", "0") == "1"
+RESPONSE_COMPRESSION = os.environ.get("RESPONSE_COMPRESSION", "0") == "1"
+COMPRESSION_MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", "500"))
+
+# Admission control (see admission.py). Disabled unless set to "1".
+ADMISSION_ENABLED = os.environ.get("ADMISSION_ENABLED", "0") == "1"
+# Concurrent requests per route class; writes share the single SQLite write lock.
+ADMISSION_READ_LIMIT = int(os.environ.get("ADMISSION_READ_LIMIT", "16"))
+ADMISSION_WRITE_LIMIT = int(os.environ.get("ADMISSION_WRITE_LIMIT", "2"))
+# Requests allowed to wait for a slot, and for how long, before a 503.
+ADMISSION_QUEUE_SIZE = int(os.environ.get("ADMISSION_QUEUE_SIZE", "32"))
+ADMISSION_QUEUE_TIMEOUT = float(os.environ.get("ADMISSION_QUEUE_TIMEOUT", "0.5"))
+ADMISSION_RETRY_AFTER = int(os.environ.get("ADMISSION_RETRY_AFTER", "1"))
+# Per-client token bucket: sustained requests/second (0 = off) and burst size.
+RATE_LIMIT_PER_SECOND = float(os.environ.get("RATE_LIMIT_PER_SECOND", "0"))
+RATE_LIMIT_BURST = int(os.environ.get("RATE_LIMIT_BURST", "20"))
+
+# Background DB maintenance (see maintenance.py). Disabled unless set to "1".
+MAINTENANCE_ENABLED = os.environ.get("MAINTENANCE_ENABLED", "0") == "1"
+# Seconds between runs of each job; 0 disables the job.
+MAINTENANCE_OPTIMIZE_INTERVAL = int(
+    os.environ.get("MAINTENANCE_OPTIMIZE_INTERVAL", "3600")
+)
+MAINTENANCE_VACUUM_INTERVAL = int(os.environ.get("MAINTENANCE_VACUUM_INTERVAL", "600"))
+MAINTENANCE_BACKUP_INTERVAL = int(os.environ.get("MAINTENANCE_BACKUP_INTERVAL", "0"))
+MAINTENANCE_BACKUP_DIR = os.environ.get("MAINTENANCE_BACKUP_DIR", "backups")
+MAINTENANCE_BACKUP_KEEP = int(os.environ.get("MAINTENANCE_BACKUP_KEEP", "7"))
+# Restarts caused by concurrent writes before a backup is redone in one step.
+MAINTENANCE_BACKUP_MAX_RESTARTS = int(
+    os.environ.get("MAINTENANCE_BACKUP_MAX_RESTARTS", "3")
+)
+# Throttle: pages per backup / vacuum step and the pause between steps.
+MAINTENANCE_STEP_PAGES = int(os.environ.get("MAINTENANCE_STEP_PAGES", "64"))
+MAINTENANCE_STEP_SLEEP = float(os.environ.get("MAINTENANCE_STEP_SLEEP", "0.01"))
+
+# On-demand request profiling (see profiling.py). Disabled unless set to "1".
+PROFILING_ENABLED = os.environ.get("PROFILING_ENABLED", "0") == "1"
+# Requests carrying this value in the X-Profile-Token header are profiled.
+PROFILING_TOKEN = os.environ.get("PROFILING_TOKEN", "")
+# Also profile every N-th request automatically (0 = off).
+PROFILING_SAMPLE_RATE = int(os.environ.get("PROFILING_SAMPLE_RATE", "0"))
+PROFILING_DIR = os.environ.get("PROFILING_DIR", "profiles")
+PROFILING_KEEP = int(os.environ.get("PROFILING_KEEP", "50"))
@@ -1,19 +1,36 @@
+import re
 import sqlite3
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 
-from flask import g
+from config import DATABASE_PATH, DB_BUSY_TIMEOUT, DB_EXECUTOR_WORKERS
+from flask import current_app, g
 
 
 # -------------------------
 # DB Connection / Setup
 # -------------------------
-def get_connection(db_name="tickets.db"):
-    conn = sqlite3.connect(db_name, check_same_thread=False)
+def get_connection(db_name="tickets.db", timeout=DB_BUSY_TIMEOUT):
+    conn = sqlite3.connect(db_name, timeout=timeout, check_same_thread=False)
     conn.row_factory = sqlite3.Row
     return conn
 
 
 def setup_db(conn):
+    # Incremental auto-vacuum lets maintenance.py hand freed pages back in
+    # small slices. It can only be switched on before the first table exists.
+    if conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()[0] == 0:
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    # WAL lets readers proceed while a writer (e.g. a ticket claim) holds the
+    # lock. It is persistent, so only switch when needed.
+    if conn.execute("PRAGMA journal_mode").fetchone()[0] not in ("wal", "memory"):
+        conn.execute("PRAGMA journal_mode=WAL")
+    # Hold the write lock for the whole migration so concurrent first
+    # connections cannot both try to add the same column.
+    conn.commit()
+    conn.execute("BEGIN IMMEDIATE")
     cursor = conn.cursor()
     cursor.execute(
         """
@@ -28,28 +45,244 @@ def setup_db(conn):
         )
     """
     )
+    ensure_priority_rank(conn)
+    ensure_assignment_columns(conn)
+    ensure_sla_columns(conn)
+    ensure_generation(conn)
+    ensure_title_index(conn)
     conn.commit()
 
 
+def _table_columns(conn):
+    return {row[1] for row in conn.execute("PRAGMA table_xinfo(tickets)")}
+
+
+def ensure_title_index(conn):
+    """Create the FTS5 prefix index over ticket titles used for suggestions.
+
+    ``tickets_title_fts`` is an external-content table (it stores only the
+    index, not a second copy of the titles) kept in sync by triggers; the
+    ``prefix`` option pre-builds 1-3 character prefix terms so a typeahead
+    query is an index seek. Returns False when SQLite lacks FTS5, in which
+    case suggestions fall back to a title scan.
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'tickets_title_fts'"
+    ).fetchone()
+    if not exists:
+        try:
+            conn.execute(
+                "CREATE VIRTUAL TABLE tickets_title_fts USING fts5("
+                "title, content='tickets', content_rowid='id', prefix='1 2 3')"
+            )
+        except sqlite3.OperationalError:
+            return False
+        conn.execute(
+            "INSERT INTO tickets_title_fts(tickets_title_fts) VALUES('rebuild')"
+        )
+    conn.execute(
+        "CREATE TRIGGER IF NOT EXISTS tickets_title_fts_insert AFTER INSERT ON tickets "
+        "BEGIN INSERT INTO tickets_title_fts(rowid, title) VALUES (new.id, new.title); END"
+    )
+    conn.execute(
+        "CREATE TRIGGER IF NOT EXISTS tickets_title_fts_delete AFTER DELETE ON tickets "
+        "BEGIN INSERT INTO tickets_title_fts(tickets_title_fts, rowid, title) "
+        "VALUES ('delete', old.id, old.title); END"
+    )
+    conn.execute(
+        "CREATE TRIGGER IF NOT EXISTS tickets_title_fts_update "
+        "AFTER UPDATE OF title ON tickets BEGIN "
+        "INSERT INTO tickets_title_fts(tickets_title_fts, rowid, title) "
+        "VALUES ('delete', old.id, old.title); "
+        "INSERT INTO tickets_title_fts(rowid, title) VALUES (new.id, new.title); END"
+    )
+    return True
+
+
+def ascii_lower(text):
+    """Fold ASCII letters only, as SQLite's LIKE does without ICU."""
+    return text.translate(_ASCII_LOWER)
+
+
+def like_contains(text):
+    r"""``%text%`` with LIKE wildcards escaped; pair it with ``ESCAPE '\'``."""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def title_tokens(text):
+    """Lower-cased word tokens, split the way FTS5's unicode61 tokenizer does."""
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+def ensure_generation(conn):
+    """Create the ``ticket_generation`` counter and the triggers that bump it.
+
+    The triggers run inside whatever transaction changes ``tickets``, so every
+    process sees the new generation exactly when it sees the new rows, even
+    for writes that bypass the service layer. (``PRAGMA data_version`` can't
+    do this: it is per connection, and ours live for one request.)
+    """
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS ticket_generation ("
+        "id INTEGER PRIMARY KEY CHECK (id = 1), generation INTEGER NOT NULL)"
+    )
+    conn.execute("INSERT OR IGNORE INTO ticket_generation VALUES (1, 0)")
+    for event in ("INSERT", "UPDATE", "DELETE"):
+        conn.execute(
+            f"CREATE TRIGGER IF NOT EXISTS tickets_generation_{event.lower()} "
+            f"AFTER {event} ON tickets BEGIN "
+            "UPDATE ticket_generation SET generation = generation + 1 WHERE id = 1; "
+            "END"
+        )
+
+
+def ensure_sla_columns(conn):
+    """Add ``escalated_at`` and the (status, created_at) index the SLA scheduler loads from."""
+    if "escalated_at" not in _table_columns(conn):
+        conn.execute("ALTER TABLE tickets ADD COLUMN escalated_at TEXT")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tickets_status_created_at "
+        "ON tickets(status, created_at)"
+    )
+
+
+def ensure_assignment_columns(conn):
+    """Add the ``assignee`` / ``lease_expires_at`` work-queue columns if missing.
+
+    A ticket is claimable when it is Open and either unassigned or its lease
+    (a UTC ``YYYY-MM-DD HH:MM:SS`` timestamp) has expired.
+    """
+    columns = _table_columns(conn)
+    if "assignee" not in columns:
+        conn.execute("ALTER TABLE tickets ADD COLUMN assignee TEXT")
+    if "lease_expires_at" not in columns:
+        conn.execute("ALTER TABLE tickets ADD COLUMN lease_expires_at TEXT")
+
+
+def ensure_priority_rank(conn):
+    """Add the generated ``priority_rank`` column and its indexes if missing.
+
+    The rank is derived from ``PRIORITIES`` (most urgent = 0), so sorting by
+    priority is a plain walk of ``idx_tickets_priority_rank`` instead of a
+    text sort. Being a VIRTUAL column it can be added to existing databases
+    with ALTER TABLE and costs no space in the table itself.
+    """
+    if "priority_rank" not in _table_columns(conn):
+        conn.execute(
+            "ALTER TABLE tickets ADD COLUMN priority_rank INTEGER "
+            f"GENERATED ALWAYS AS ({priority_rank_sql()}) VIRTUAL"
+        )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tickets_priority_rank "
+        "ON tickets(priority_rank)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tickets_status_priority_rank "
+        "ON tickets(status, priority_rank)"
+    )
+
+
+def priority_rank_sql(column="priority"):
+    """SQL CASE expression mapping a priority (any case) to its rank."""
+    whens = " ".join(
+        f"WHEN '{name.upper()}' THEN {rank}" for name, rank in PRIORITY_RANKS.items()
+    )
+    return f"CASE UPPER({column}) {whens} ELSE {len(PRIORITIES)} END"
+
+
+def priority_rank(priority):
+    """Python twin of ``priority_rank_sql`` for non-SQL backends."""
+    return _UPPER_PRIORITY_RANKS.get((priority or "").upper(), len(PRIORITIES))
+
+
+# Database files whose schema this process has already set up / migrated
+_ready_databases = set()
+
+
 def get_db():
     if "db" not in g:
-        g.db = get_connection()
-        setup_db(g.db)
+        path = current_app.config.get("DATABASE_PATH", DATABASE_PATH)
+        g.db = get_connection(
+            path, current_app.config.get("DB_BUSY_TIMEOUT", DB_BUSY_TIMEOUT)
+        )
+        if path == ":memory:" or path not in _ready_databases:
+            setup_db(g.db)
+            _ready_databases.add(path)
     return g.db
 
 
+# -------------------------
+# Storage Backend
+# -------------------------
+def get_backend():
+    """Return the ticket storage backend configured for the current app.
+
+    The SQLite backend wraps the per-request connection from ``get_db``; the
+    memory backend is a single store shared by the whole app.
+    """
+    if "backend" not in g:
+        kind = current_app.config.get("STORAGE_BACKEND", "sqlite")
+        if kind == "memory":
+            from storage.memory_backend import MemoryBackend
+
+            backend = current_app.extensions.get("ticket_memory_backend")
+            if backend is None:
+                backend = current_app.extensions.setdefault(
+                    "ticket_memory_backend", MemoryBackend()
+                )
+            g.backend = backend
+        elif kind == "sqlite":
+            from storage.sqlite_backend import SQLiteBackend
+
+            g.backend = SQLiteBackend(get_db())
+        else:
+            raise ValueError(f"Unknown STORAGE_BACKEND: {kind}")
+    return g.backend
+
+
 @contextmanager
 def db_session():
-    conn = get_db()
+    backend = get_backend()
     try:
-        yield conn
-        conn.commit()
+        yield backend
+        backend.commit()
     except Exception:
-        conn.rollback()
+        backend.rollback()
         raise
 
 
+# -------------------------
+# Async DB Executor
+# -------------------------
+_executor_lock = threading.Lock()
+
+
+def get_db_executor(app) -> ThreadPoolExecutor:
+    """Return the app's bounded thread pool for blocking DB calls.
+
+    Async callers offload every storage call here so the event loop never
+    blocks on SQLite; the bound keeps write contention on the file in check.
+    """
+    with _executor_lock:
+        executor = app.extensions.get("db_executor")
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=app.config.get("DB_EXECUTOR_WORKERS", DB_EXECUTOR_WORKERS),
+                thread_name_prefix="ticket-db",
+            )
+            app.extensions["db_executor"] = executor
+        return executor
+
+
+def shutdown_db_executor(app) -> None:
+    executor = app.extensions.pop("db_executor", None)
+    if executor:
+        executor.shutdown(wait=True)
+
+
 def close_db(error):
+    g.pop("backend", None)
     db = g.pop("db", None)
     if db:
         db.close()
@@ -60,3 +293,13 @@ def close_db(error):
 # -------------------------
 PRIORITIES = ["Low", "Medium", "High"]
 STATUSES = ["Open", "In Progress", "Closed"]
+# Statuses whose tickets are still on the SLA clock
+SLA_STATUSES = ["Open", "In Progress"]
+# Characters of description returned by list queries (full text: get_ticket)
+DESCRIPTION_PREVIEW_LENGTH = 100
+# Letters and digits; underscores and punctuation separate tokens
+_TOKEN_RE = re.compile(r"[^\W_]+")
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+# Sort rank per priority: most urgent first (High=0 ... Low=2)
+PRIORITY_RANKS = {name: rank for rank, name in enumerate(reversed(PRIORITIES))}
+_UPPER_PRIORITY_RANKS = {name.upper(): rank for name, rank in PRIORITY_RANKS.items()}
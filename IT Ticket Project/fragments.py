@@ -0,0 +1,84 @@
+"""Template rendering caches for the ticket list.
+
+* Row fragments: ``{{ ticket_row(t) }}`` renders ``_ticket_row.html`` once per
+  ticket version and reuses the markup on later page views. Entries are keyed
+  on ``(id, updated_at)``. Because ``updated_at`` only has second resolution,
+  and escalation does not touch it, a hit is also checked against the row's
+  displayed fields before it is reused.
+* Bytecode: with ``JINJA_BYTECODE_CACHE`` on, compiled templates are kept on
+  disk (``JINJA_BYTECODE_CACHE_DIR``, default: ``jinja_cache`` in the app's
+  instance folder), so a freshly started worker skips parsing and compiling
+  them.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Tuple
+
+from flask import current_app
+from jinja2 import FileSystemBytecodeCache
+from markupsafe import Markup
+
+ROW_TEMPLATE = "_ticket_row.html"
+
+
+class FragmentCache:
+    """Bounded LRU of rendered markup, each entry tagged with its source fields."""
+
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Tuple[tuple, Markup]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, fields: tuple):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] == fields:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, fields: tuple, markup: Markup) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (fields, markup)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+def ticket_row(ticket: Any) -> Markup:
+    """Jinja global: the cached ``<tr>`` markup for one ticket summary."""
+    cache: FragmentCache = current_app.extensions["fragment_cache"]
+    key = (ticket.id, ticket.updated_at)
+    fields = tuple(vars(ticket).values())
+    markup = cache.get(key, fields)
+    if markup is None:
+        template = current_app.jinja_env.get_template(ROW_TEMPLATE)
+        markup = Markup(template.render(t=ticket))
+        cache.put(key, fields, markup)
+    return markup
+
+
+def init_fragments(app) -> None:
+    """Register ``ticket_row`` and, if enabled, the Jinja bytecode cache."""
+    app.extensions["fragment_cache"] = FragmentCache(
+        int(app.config.get("FRAGMENT_CACHE_SIZE", 2048))
+    )
+    app.jinja_env.globals["ticket_row"] = ticket_row
+    if app.config.get("JINJA_BYTECODE_CACHE"):
+        directory = app.config.get("JINJA_BYTECODE_CACHE_DIR") or os.path.join(
+            app.instance_path, "jinja_cache"
+        )
+        os.makedirs(directory, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory)
@@ -0,0 +1,63 @@
+"""Optional strong ETags and gzip compression for full-page responses.
+
+``RESPONSE_ETAGS``: 200 responses to GET/HEAD get a strong ETag (SHA-1 of the
+body). If the request carries a matching ``If-None-Match``, the response
+becomes a bodiless 304.
+
+``RESPONSE_COMPRESSION``: textual responses of at least
+``COMPRESSION_MIN_SIZE`` bytes are gzipped for clients that accept it.
+Compression runs after the ETag check, so a 304 never pays for it. A
+gzipped body is a different representation, so it gets its own ETag
+(``"<sha1>-gzip"``). Both variants carry ``Vary: Accept-Encoding``.
+"""
+
+import gzip
+import hashlib
+
+from flask import request
+
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript")
+
+
+def _compressible(response, min_size: int) -> bool:
+    return (
+        response.status_code == 200
+        and not response.direct_passthrough
+        and "Content-Encoding" not in response.headers
+        and (response.mimetype or "").startswith(COMPRESSIBLE_TYPES)
+        and response.content_length is not None
+        and response.content_length >= min_size
+    )
+
+
+def init_http_cache(app) -> None:
+    """Install the ETag / compression after-request hook if either is enabled."""
+    etags = bool(app.config.get("RESPONSE_ETAGS"))
+    compression = bool(app.config.get("RESPONSE_COMPRESSION"))
+    if not (etags or compression):
+        return
+    min_size = int(app.config.get("COMPRESSION_MIN_SIZE", 500))
+    level = int(app.config.get("COMPRESSION_LEVEL", 6))
+
+    @app.after_request
+    def _etag_and_compress(response):
+        compress = False
+        if compression and _compressible(response, min_size):
+            response.vary.add("Accept-Encoding")
+            compress = "gzip" in request.accept_encodings
+
+        if etags and request.method in ("GET", "HEAD") and response.status_code == 200:
+            if not response.direct_passthrough and "ETag" not in response.headers:
+                digest = hashlib.sha1(response.get_data()).hexdigest()
+                response.set_etag(f"{digest}-gzip" if compress else digest)
+                response.make_conditional(request)
+                if response.status_code == 304:
+                    return response
+
+        if compress:
+            # mtime=0 keeps the gzip bytes, and so the ETag, deterministic
+            response.set_data(
+                gzip.compress(response.get_data(), compresslevel=level, mtime=0)
+            )
+            response.headers["Content-Encoding"] = "gzip"
+        return response
@@ -0,0 +1,357 @@
+"""Online SQLite maintenance: snapshots, statistics and space reclamation.
+
+Three jobs, each done in small throttled steps on its own connection so live
+requests keep getting the database between steps:
+
+* ``backup`` - consistent snapshot through the sqlite3 backup API, copying
+  ``MAINTENANCE_STEP_PAGES`` pages per step and pausing
+  ``MAINTENANCE_STEP_SLEEP`` seconds in between. The copy is written next to
+  its target and renamed into place, so a half-written file is never seen.
+  Writes from other processes make SQLite restart a stepped copy; after
+  ``MAINTENANCE_BACKUP_MAX_RESTARTS`` restarts the copy is redone in a single
+  step, which reads one consistent snapshot (WAL keeps writers going).
+* ``optimize`` - ``PRAGMA optimize`` (cheap, only re-analyzes what changed),
+  or a full ``ANALYZE`` when asked.
+* ``vacuum`` - ``PRAGMA incremental_vacuum`` in slices of
+  ``MAINTENANCE_STEP_PAGES`` pages, one short write transaction per slice.
+  Needs ``auto_vacuum=INCREMENTAL``: new databases get it from ``setup_db``,
+  older ones need a one-off ``enable-incremental-vacuum`` (a full VACUUM, so
+  run it in a quiet period).
+
+Run by hand::
+
+    python maintenance.py --db tickets.db status
+    python maintenance.py --db tickets.db backup backups/tickets.db
+    python maintenance.py --db tickets.db optimize --analyze
+    python maintenance.py --db tickets.db vacuum --max-pages 2000
+
+or set ``MAINTENANCE_ENABLED=1`` to run all three periodically from a
+background thread (see ``init_maintenance``).
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+AUTO_VACUUM_INCREMENTAL = 2
+
+log = logging.getLogger(__name__)
+
+
+class BackupRestarted(Exception):
+    """Raised from the backup progress callback to abandon a stepped copy."""
+
+
+def connect(db_path: str, busy_timeout_ms: int = 5000) -> sqlite3.Connection:
+    """Maintenance connection that waits briefly for writers instead of failing."""
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+    return conn
+
+
+def status(conn: sqlite3.Connection) -> dict:
+    def pragma(name):
+        return conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+    page_size = pragma("page_size")
+    free = pragma("freelist_count")
+    return {
+        "page_size": page_size,
+        "page_count": pragma("page_count"),
+        "freelist_count": free,
+        "free_bytes": free * page_size,
+        "auto_vacuum": pragma("auto_vacuum"),
+        "journal_mode": pragma("journal_mode"),
+    }
+
+
+# -------------------------
+# Jobs
+# -------------------------
+def backup(
+    conn: sqlite3.Connection,
+    dest_path: str,
+    pages: int = 64,
+    sleep: float = 0.01,
+    max_restarts: int = 3,
+) -> int:
+    """Snapshot ``conn`` into ``dest_path`` in steps of ``pages`` pages.
+
+    Returns the number of pages copied. A write from another process makes
+    SQLite restart the copy; after ``max_restarts`` restarts the stepped copy
+    is abandoned and redone as one step. Errors propagate and leave no
+    ``.part`` file behind.
+    """
+    tmp_path = f"{dest_path}.part"
+    state = {"pages": 0, "remaining": None, "restarts": 0}
+
+    def progress(_status, remaining, total):
+        if state["remaining"] is not None and remaining > state["remaining"]:
+            state["restarts"] += 1
+            if state["restarts"] > max_restarts:
+                raise BackupRestarted()
+        state["remaining"] = remaining
+        state["pages"] = total - remaining
+        if remaining and sleep:
+            time.sleep(sleep)
+
+    try:
+        if os.path.dirname(dest_path):
+            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+        dest = sqlite3.connect(tmp_path)
+        try:
+            try:
+                conn.backup(dest, pages=pages, progress=progress)
+            except BackupRestarted:
+                log.warning(
+                    "backup of %s restarted %d times by concurrent writes; "
+                    "copying in a single step",
+                    dest_path,
+                    state["restarts"],
+                )
+                conn.backup(dest, pages=-1)
+                state["pages"] = conn.execute("PRAGMA page_count").fetchone()[0]
+            # The snapshot is a standalone file; don't leave it in WAL mode
+            dest.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            dest.close()
+        os.replace(tmp_path, dest_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return state["pages"]
+
+
+def optimize(conn: sqlite3.Connection, analyze: bool = False) -> None:
+    """Refresh planner statistics: ``PRAGMA optimize`` or a full ``ANALYZE``."""
+    if analyze:
+        conn.execute("ANALYZE")
+    else:
+        # Bounded per-index sampling keeps optimize cheap on big tables
+        conn.execute("PRAGMA analysis_limit=400")
+        conn.execute("PRAGMA optimize")
+    conn.commit()
+
+
+def incremental_vacuum(
+    conn: sqlite3.Connection,
+    max_pages: Optional[int] = None,
+    pages: int = 64,
+    sleep: float = 0.01,
+) -> int:
+    """Return up to ``max_pages`` free pages to the OS, ``pages`` at a time.
+
+    Returns the number of pages reclaimed (0 when auto_vacuum is not
+    INCREMENTAL, since the pragma is then a no-op).
+    """
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != AUTO_VACUUM_INCREMENTAL:
+        return 0
+    reclaimed = 0
+    while max_pages is None or reclaimed < max_pages:
+        free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        step = min(pages, free)
+        if max_pages is not None:
+            step = min(step, max_pages - reclaimed)
+        if step <= 0:
+            break
+        conn.execute(f"PRAGMA incremental_vacuum({int(step)})").fetchall()
+        conn.commit()
+        freed = free - conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if freed <= 0:
+            break
+        reclaimed += freed
+        if sleep:
+            time.sleep(sleep)
+    return reclaimed
+
+
+def enable_incremental_vacuum(conn: sqlite3.Connection) -> bool:
+    """Switch an existing database to auto_vacuum=INCREMENTAL.
+
+    Takes a full VACUUM (exclusive, proportional to file size). Returns False
+    when the database was already incremental.
+    """
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == AUTO_VACUUM_INCREMENTAL:
+        return False
+    conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    conn.execute("VACUUM")
+    return True
+
+
+# -------------------------
+# Background worker
+# -------------------------
+def prune_backups(directory: str, prefix: str, keep: int) -> List[str]:
+    """Delete all but the newest ``keep`` ``<prefix>-*.db`` snapshots."""
+    snapshots = sorted(
+        f
+        for f in os.listdir(directory)
+        if f.startswith(prefix + "-") and f.endswith(".db")
+    )
+    removed = snapshots[: max(len(snapshots) - keep, 0)]
+    for name in removed:
+        os.remove(os.path.join(directory, name))
+    return removed
+
+
+class MaintenanceWorker:
+    """Runs optimize / vacuum / backup on their own intervals from one thread.
+
+    An interval of 0 disables that job.
+    """
+
+    def __init__(self, db_path: str, config, logger=None, clock=time.monotonic):
+        self.db_path = db_path
+        self.logger = logger
+        self.clock = clock
+        self.pages = int(config.get("MAINTENANCE_STEP_PAGES", 64))
+        self.sleep = float(config.get("MAINTENANCE_STEP_SLEEP", 0.01))
+        self.backup_dir = config.get("MAINTENANCE_BACKUP_DIR", "backups")
+        self.backup_keep = int(config.get("MAINTENANCE_BACKUP_KEEP", 7))
+        self.backup_max_restarts = int(config.get("MAINTENANCE_BACKUP_MAX_RESTARTS", 3))
+        self.intervals = {
+            "optimize": float(config.get("MAINTENANCE_OPTIMIZE_INTERVAL", 3600)),
+            "vacuum": float(config.get("MAINTENANCE_VACUUM_INTERVAL", 600)),
+            "backup": float(config.get("MAINTENANCE_BACKUP_INTERVAL", 0)),
+        }
+        self._last_run = {job: None for job in self.intervals}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def due(self) -> List[str]:
+        now = self.clock()
+        return [
+            job
+            for job, interval in self.intervals.items()
+            if interval > 0
+            and (self._last_run[job] is None or now - self._last_run[job] >= interval)
+        ]
+
+    def run_job(self, job: str, conn: sqlite3.Connection):
+        if job == "optimize":
+            return optimize(conn)
+        if job == "vacuum":
+            return incremental_vacuum(conn, pages=self.pages, sleep=self.sleep)
+        stem = os.path.splitext(os.path.basename(self.db_path))[0]
+        dest = os.path.join(
+            self.backup_dir, f"{stem}-{time.strftime('%Y%m%d-%H%M%S')}.db"
+        )
+        result = backup(
+            conn,
+            dest,
+            pages=self.pages,
+            sleep=self.sleep,
+            max_restarts=self.backup_max_restarts,
+        )
+        prune_backups(self.backup_dir, stem, self.backup_keep)
+        return result
+
+    def run_due(self) -> List[str]:
+        """Run every job whose interval has elapsed. Returns the jobs run."""
+        jobs = self.due()
+        if not jobs:
+            return []
+        conn = connect(self.db_path)
+        try:
+            for job in jobs:
+                try:
+                    result = self.run_job(job, conn)
+                    if self.logger:
+                        self.logger.info("maintenance %s done: %s", job, result)
+                except Exception:
+                    # A failed job (locked DB, full disk, ...) must not kill
+                    # the thread; the other jobs still run on schedule.
+                    (self.logger or log).exception("maintenance %s failed", job)
+                self._last_run[job] = self.clock()
+        finally:
+            conn.close()
+        return jobs
+
+    def _run(self):
+        active = [i for i in self.intervals.values() if i > 0]
+        tick = min(active + [60.0])
+        while not self._stop.wait(tick):
+            self.run_due()
+
+    def start(self):
+        # First run happens one tick after startup, not during it
+        now = self.clock()
+        self._last_run = {job: now for job in self.intervals}
+        self._thread = threading.Thread(
+            target=self._run, name="db-maintenance", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+
+def init_maintenance(app) -> Optional[MaintenanceWorker]:
+    """Start the maintenance thread when ``MAINTENANCE_ENABLED`` is set."""
+    if not app.config.get("MAINTENANCE_ENABLED"):
+        return None
+    if app.config.get("STORAGE_BACKEND", "sqlite") != "sqlite":
+        return None
+    worker = MaintenanceWorker(app.config["DATABASE_PATH"], app.config, app.logger)
+    app.extensions["db_maintenance"] = worker
+    worker.start()
+    return worker
+
+
+# -------------------------
+# CLI
+# -------------------------
+def main(argv: Optional[List[str]] = None):
+    import config
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", default=config.DATABASE_PATH)
+    parser.add_argument("--pages", type=int, default=config.MAINTENANCE_STEP_PAGES)
+    parser.add_argument(
+        "--sleep", type=float, default=config.MAINTENANCE_STEP_SLEEP, help="seconds"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status")
+    backup_cmd = commands.add_parser("backup")
+    backup_cmd.add_argument("dest")
+    optimize_cmd = commands.add_parser("optimize")
+    optimize_cmd.add_argument("--analyze", action="store_true", help="full ANALYZE")
+    vacuum_cmd = commands.add_parser("vacuum")
+    vacuum_cmd.add_argument("--max-pages", type=int)
+    commands.add_parser("enable-incremental-vacuum")
+    args = parser.parse_args(argv)
+
+    conn = connect(args.db)
+    try:
+        if args.command == "status":
+            for key, value in status(conn).items():
+                print(f"{key:<16} {value}")
+        elif args.command == "backup":
+            copied = backup(conn, args.dest, pages=args.pages, sleep=args.sleep)
+            print(f"Copied {copied} pages to {args.dest}")
+        elif args.command == "optimize":
+            optimize(conn, analyze=args.analyze)
+            print("ANALYZE done" if args.analyze else "PRAGMA optimize done")
+        elif args.command == "vacuum":
+            reclaimed = incremental_vacuum(
+                conn, max_pages=args.max_pages, pages=args.pages, sleep=args.sleep
+            )
+            print(f"Reclaimed {reclaimed} pages")
+        else:
+            changed = enable_incremental_vacuum(conn)
+            print(
+                "auto_vacuum set to INCREMENTAL" if changed else "Already INCREMENTAL"
+            )
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,35 @@
 # models/ticket.py
+import sqlite3
+from itertools import islice
+
+from database import DESCRIPTION_PREVIEW_LENGTH, like_contains, title_tokens
+
+# sort_by value -> column. Priority sorts on the indexed integer rank.
+SORT_COLUMNS = {
+    "priority": "priority_rank",
+    "status": "status",
+    "created_at": "created_at",
+}
+
+# Narrow projection for list views: a bounded description preview instead of
+# the full (possibly multi-kilobyte) body.
+LIST_COLUMNS = (
+    "id, title, "
+    f"substr(description, 1, {DESCRIPTION_PREVIEW_LENGTH}) AS description_preview, "
+    "priority, status, assignee, escalated_at, created_at, updated_at"
+)
+
+# Open tickets nobody currently holds a lease on, most urgent then oldest first.
+# Walks idx_tickets_status_priority_rank (id is the implicit last index column),
+# skipping only the handful of tickets that are currently leased.
+CLAIMABLE_SQL = """
+    SELECT id FROM tickets
+    WHERE status = 'Open'
+      AND (assignee IS NULL OR lease_expires_at <= datetime('now'))
+    ORDER BY priority_rank, id
+    LIMIT 1
+"""
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
 
 # -------------------------
 # CRUD Operations
@@ -41,6 +72,137 @@ def delete_ticket(conn, ticket_id: int) -> int:
         return cur.rowcount
 
 
+def claim_next_ticket(conn, assignee: str, lease_seconds: int):
+    """
+    Atomically assign the most urgent, oldest claimable Open ticket to assignee
+    with a lease of lease_seconds. Returns the claimed ticket or None.
+    """
+    from types import SimpleNamespace
+
+    lease = f"{int(lease_seconds):+d} seconds"
+    with conn:
+        if HAS_RETURNING:
+            rows = conn.execute(
+                f"""
+                UPDATE tickets
+                SET assignee=?, lease_expires_at=datetime('now', ?),
+                    updated_at=CURRENT_TIMESTAMP
+                WHERE id = ({CLAIMABLE_SQL})
+                RETURNING *
+            """,
+                (assignee, lease),
+            ).fetchall()
+        else:
+            # Pre-3.35 SQLite: take the write lock first so select+update is atomic
+            conn.execute("BEGIN IMMEDIATE")
+            found = conn.execute(CLAIMABLE_SQL).fetchone()
+            rows = []
+            if found:
+                conn.execute(
+                    """
+                    UPDATE tickets
+                    SET assignee=?, lease_expires_at=datetime('now', ?),
+                        updated_at=CURRENT_TIMESTAMP
+                    WHERE id=?
+                """,
+                    (assignee, lease, found[0]),
+                )
+                rows = conn.execute(
+                    "SELECT * FROM tickets WHERE id=?", (found[0],)
+                ).fetchall()
+    return SimpleNamespace(**dict(rows[0])) if rows else None
+
+
+def release_ticket(conn, ticket_id: int, assignee: str) -> int:
+    """Return a ticket held by assignee to the queue. Returns rows affected."""
+    with conn:
+        cur = conn.execute(
+            """
+            UPDATE tickets
+            SET assignee=NULL, lease_expires_at=NULL, updated_at=CURRENT_TIMESTAMP
+            WHERE id=? AND assignee=?
+        """,
+            (ticket_id, assignee),
+        )
+        return cur.rowcount
+
+
+def sla_candidates(conn, statuses):
+    """
+    Yield (id, priority, status, created_at) for every ticket in statuses that
+    has not been escalated yet. Walks idx_tickets_status_created_at.
+    """
+    placeholders = ", ".join("?" for _ in statuses)
+    cur = conn.execute(
+        f"""
+        SELECT id, priority, status, created_at FROM tickets
+        WHERE status IN ({placeholders}) AND escalated_at IS NULL
+        ORDER BY status, created_at
+    """,
+        list(statuses),
+    )
+    return [tuple(r) for r in cur.fetchall()]
+
+
+def escalate_ticket(conn, ticket_id: int, statuses) -> int:
+    """
+    Mark a ticket escalated if it is still in statuses and not yet escalated.
+    Returns rows affected (0 when another worker already escalated it).
+    """
+    placeholders = ", ".join("?" for _ in statuses)
+    with conn:
+        cur = conn.execute(
+            f"""
+            UPDATE tickets SET escalated_at=CURRENT_TIMESTAMP
+            WHERE id=? AND escalated_at IS NULL AND status IN ({placeholders})
+        """,
+            [ticket_id, *statuses],
+        )
+        return cur.rowcount
+
+
+def suggest_titles(conn, prefix: str, limit: int = 8):
+    """
+    Return up to limit (id, title) pairs, newest first, whose title has a word
+    starting with each word of prefix. Seeks the FTS5 prefix index; databases
+    without FTS5 fall back to scanning titles.
+    """
+    tokens = title_tokens(prefix)
+    if not tokens or limit <= 0:
+        return []
+    try:
+        cur = conn.execute(
+            """
+            SELECT id, title FROM tickets WHERE id IN (
+                SELECT rowid FROM tickets_title_fts WHERE tickets_title_fts MATCH ?
+                ORDER BY rowid DESC LIMIT ?
+            )
+            ORDER BY id DESC
+        """,
+            (" AND ".join(f'"{t}"*' for t in tokens), limit),
+        )
+    except sqlite3.OperationalError:
+        # Same meaning as the MATCH: every token starts a word of the title.
+        # LIKE can't express word starts for every separator unicode61 splits
+        # on, so scan newest first and tokenize each title.
+        cur = conn.execute("SELECT id, title FROM tickets ORDER BY id DESC")
+        matches = (r for r in cur if _starts_words(r[1], tokens))
+        return [tuple(r) for r in islice(matches, limit)]
+    return [tuple(r) for r in cur.fetchall()]
+
+
+def _starts_words(title: str, tokens) -> bool:
+    words = title_tokens(title)
+    return all(any(w.startswith(t) for w in words) for t in tokens)
+
+
+def get_generation(conn) -> int:
+    """Current value of the counter bumped by every change to tickets."""
+    return conn.execute(
+        "SELECT generation FROM ticket_generation WHERE id = 1"
+    ).fetchone()[0]
+
+
 def get_ticket(conn, ticket_id: int):
     """Retrieve a single ticket by ID. Returns None if not found."""
     cur = conn.execute("SELECT * FROM tickets WHERE id=?", (ticket_id,))
@@ -54,12 +216,21 @@ def get_ticket(conn, ticket_id: int):
 
 
 def list_tickets(
-    conn, filter_status=None, sort_by=None, search=None, offset=0, limit=10
+    conn,
+    filter_status=None,
+    sort_by=None,
+    search=None,
+    offset=0,
+    limit=10,
+    sort_dir=None,
 ):
     """
     Retrieve a list of tickets with optional filtering, search, sorting, and pagination.
+    sort_dir is "asc" (default) or "desc"; priority sorts most urgent first.
+    Rows carry description_preview instead of description; use get_ticket for
+    the full body.
     """
-    query = "SELECT * FROM tickets WHERE 1=1"
+    query = f"SELECT {LIST_COLUMNS} FROM tickets WHERE 1=1"
     params = []
 
     if filter_status:
@@ -67,12 +238,16 @@ def list_tickets(
         params.append(filter_status)
 
     if search:
-        query += " AND (title LIKE ? OR description LIKE ?)"
-        search_term = f"%{search}%"
+        query += " AND (title LIKE ? ESCAPE '\\' OR description LIKE ? ESCAPE '\\')"
+        search_term = like_contains(search)
         params.extend([search_term, search_term])
 
-    if sort_by in ("priority", "status", "created_at"):
-        query += f" ORDER BY {sort_by}"
+    # id breaks ties so pagination is stable; both walk the same index
+    direction = "DESC" if sort_dir == "desc" else "ASC"
+    if sort_by in SORT_COLUMNS:
+        query += f" ORDER BY {SORT_COLUMNS[sort_by]} {direction}, id {direction}"
+    else:
+        query += " ORDER BY id"
 
     query += " LIMIT ? OFFSET ?"
     params.extend([limit, offset])
@@ -96,8 +271,8 @@ def count_tickets(conn, filter_status=None, search=None) -> int:
         params.append(filter_status)
 
     if search:
-        query += " AND (title LIKE ? OR description LIKE ?)"
-        search_term = f"%{search}%"
+        query += " AND (title LIKE ? ESCAPE '\\' OR description LIKE ? ESCAPE '\\')"
+        search_term = like_contains(search)
         params.extend([search_term, search_term])
 
     cur = conn.execute(query, params)
@@ -0,0 +1,253 @@
+"""On-demand per-request profiling.
+
+When ``PROFILING_ENABLED`` is set, a request is profiled if either
+
+* it carries an ``X-Profile-Token`` header equal to ``PROFILING_TOKEN``, or
+* it is the N-th request since the last automatic sample
+  (``PROFILING_SAMPLE_RATE`` = N, 0 disables automatic sampling).
+
+A profiled request runs under ``cProfile`` while a sampler thread records its
+stack every ``PROFILING_INTERVAL`` seconds. Three files are written to
+``PROFILING_DIR`` per request, sharing one stem:
+
+* ``<stem>.collapsed`` - folded stacks, ready for ``flamegraph.pl`` / speedscope
+* ``<stem>.txt`` - route/service/SQL/template breakdown plus the top-N functions
+* ``<stem>.prof`` - raw pstats dump (``snakeviz``, ``python -m pstats``)
+
+Only the newest ``PROFILING_KEEP`` profiles are kept.
+"""
+
+import cProfile
+import hmac
+import io
+import itertools
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, Tuple
+
+PROFILE_HEADER = "HTTP_X_PROFILE_TOKEN"
+ENDPOINT_KEY = "ticket.endpoint"
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+FuncKey = Tuple[str, int, str]
+
+
+# -------------------------
+# Stack sampler
+# -------------------------
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return (
+        f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    )
+
+
+def collapse_stack(frame) -> str:
+    """Render a frame's stack root-first in folded (``a;b;c``) form."""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class StackSampler(threading.Thread):
+    """Samples one thread's stack at a fixed interval into a Counter.
+
+    Resolution is bounded by the interpreter's switch interval (5 ms by
+    default) while the target thread is running pure Python code.
+    """
+
+    def __init__(self, thread_id: int, interval: float):
+        super().__init__(name="request-profiler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._done = threading.Event()
+
+    def run(self):
+        while not self._done.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[collapse_stack(frame)] += 1
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+
+# -------------------------
+# Category breakdown
+# -------------------------
+def _in_dir(name: str) -> Callable[[FuncKey], bool]:
+    prefix = os.path.join(PROJECT_DIR, name) + os.sep
+    return lambda func: os.path.abspath(func[0]).startswith(prefix)
+
+
+def _is_sql(func: FuncKey) -> bool:
+    return func[0] == "~" and "sqlite3." in func[2]
+
+
+def _is_template(func: FuncKey) -> bool:
+    return (
+        func[0].endswith(os.path.join("flask", "templating.py"))
+        and func[2] == "render_template"
+    )
+
+
+CATEGORIES: Dict[str, Callable[[FuncKey], bool]] = {
+    "route": _in_dir("routes"),
+    "service": _in_dir("services"),
+    "sql": _is_sql,
+    "template": _is_template,
+}
+
+
+def category_times(stats: pstats.Stats) -> Dict[str, Tuple[float, int]]:
+    """Return {category: (cumulative seconds, calls)}.
+
+    Only call edges entering a category from outside it are counted, so nested
+    calls (a service calling another service) are not double counted.
+    """
+    result = {}
+    for name, matches in CATEGORIES.items():
+        total, calls = 0.0, 0
+        for func, (_, nc, _, ct, callers) in stats.stats.items():
+            if not matches(func):
+                continue
+            outside = [edge for caller, edge in callers.items() if not matches(caller)]
+            if not callers:
+                total, calls = total + ct, calls + nc
+            for edge_nc, _, _, edge_ct in outside:
+                total, calls = total + edge_ct, calls + edge_nc
+        result[name] = (total, calls)
+    return result
+
+
+# -------------------------
+# WSGI middleware
+# -------------------------
+class RequestProfiler:
+    """WSGI middleware that profiles selected requests end to end."""
+
+    def __init__(self, wsgi_app, config):
+        self.wsgi_app = wsgi_app
+        self.token = config.get("PROFILING_TOKEN") or ""
+        self.sample_rate = int(config.get("PROFILING_SAMPLE_RATE") or 0)
+        self.output_dir = config.get("PROFILING_DIR", "profiles")
+        self.keep = int(config.get("PROFILING_KEEP", 50))
+        self.top_n = int(config.get("PROFILING_TOP_N", 25))
+        self.interval = float(config.get("PROFILING_INTERVAL", 0.001))
+        self._counter = itertools.count(1)
+        self._counter_lock = threading.Lock()
+        # cProfile cannot profile two threads at once on every Python version;
+        # a request arriving while another is profiled is simply served as usual.
+        self._active = threading.Lock()
+
+    def _should_profile(self, environ) -> bool:
+        supplied = environ.get(PROFILE_HEADER)
+        if self.token and supplied:
+            return hmac.compare_digest(supplied.encode(), self.token.encode())
+        if self.sample_rate > 0:
+            with self._counter_lock:
+                return next(self._counter) % self.sample_rate == 0
+        return False
+
+    def __call__(self, environ, start_response):
+        if not self._should_profile(environ) or not self._active.acquire(False):
+            return self.wsgi_app(environ, start_response)
+        try:
+            return self._profile(environ, start_response)
+        finally:
+            self._active.release()
+
+    def _profile(self, environ, start_response):
+        status_holder = {}
+
+        def capture_status(status, headers, exc_info=None):
+            status_holder["status"] = status
+            return start_response(status, headers, exc_info)
+
+        sampler = StackSampler(threading.get_ident(), self.interval)
+        profiler = cProfile.Profile()
+        sampler.start()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            result = self.wsgi_app(environ, capture_status)
+            # Drain the body inside the profile so streamed templates count too
+            body = list(result)
+            if hasattr(result, "close"):
+                result.close()
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - start
+            sampler.stop()
+        self._write(
+            environ, status_holder.get("status", "?"), elapsed, profiler, sampler
+        )
+        return body
+
+    # -------------------------
+    # Output
+    # -------------------------
+    def _write(self, environ, status, elapsed, profiler, sampler):
+        os.makedirs(self.output_dir, exist_ok=True)
+        endpoint = environ.get(ENDPOINT_KEY) or "unknown"
+        # Sub-second suffix keeps stems unique and in chronological sort order
+        now_ns = time.time_ns()
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now_ns // 10**9))
+        stem = os.path.join(self.output_dir, f"{stamp}-{now_ns % 10**9:09d}-{endpoint}")
+
+        with open(f"{stem}.collapsed", "w") as fh:
+            for stack, count in sampler.stacks.most_common():
+                fh.write(f"{stack} {count}\n")
+
+        profiler.dump_stats(f"{stem}.prof")
+        out = io.StringIO()
+        stats = pstats.Stats(profiler, stream=out)
+        path = environ.get("PATH_INFO", "")
+        if environ.get("QUERY_STRING"):
+            path += "?" + environ["QUERY_STRING"]
+        out.write(f"{environ.get('REQUEST_METHOD')} {path}\n")
+        out.write(f"endpoint: {endpoint}  status: {status}\n")
+        out.write(f"wall time: {elapsed * 1000:.2f} ms\n")
+        out.write(f"stack samples: {sum(sampler.stacks.values())}\n\n")
+        out.write("Category breakdown (cumulative):\n")
+        for name, (seconds, calls) in category_times(stats).items():
+            out.write(f"  {name:<10} {seconds * 1000:9.2f} ms  {calls:6d} calls\n")
+        out.write(f"\nTop {self.top_n} functions by cumulative time:\n")
+        stats.sort_stats("cumulative").print_stats(self.top_n)
+        with open(f"{stem}.txt", "w") as fh:
+            fh.write(out.getvalue())
+
+        self._rotate()
+
+    def _rotate(self):
+        stems = sorted(
+            f[: -len(".txt")] for f in os.listdir(self.output_dir) if f.endswith(".txt")
+        )
+        for stem in stems[: max(len(stems) - self.keep, 0)]:
+            for ext in (".txt", ".collapsed", ".prof"):
+                try:
+                    os.remove(os.path.join(self.output_dir, stem + ext))
+                except FileNotFoundError:
+                    pass
+
+
+def init_profiling(app):
+    """Install the profiler on ``app`` when ``PROFILING_ENABLED`` is set."""
+    if not app.config.get("PROFILING_ENABLED"):
+        return
+
+    from flask import request
+
+    @app.before_request
+    def _record_endpoint():
+        request.environ[ENDPOINT_KEY] = request.endpoint
+
+    app.wsgi_app = RequestProfiler(app.wsgi_app, app.config)
@@ -1,10 +1,14 @@
 # routes/tickets.py
-from flask import Blueprint, flash, redirect, render_template, request, url_for
+from flask import (Blueprint, flash, jsonify, redirect, render_template,
+                   request, url_for)
 from models.ticket_model import PRIORITIES, STATUSES
-from services.ticket_service import (count_tickets_service,
+from services.ticket_service import (claim_next_ticket_service,
+                                     count_tickets_service,
                                      create_ticket_service,
                                      delete_ticket_service, get_ticket_service,
                                      list_tickets_service,
+                                     release_ticket_service,
+                                     suggest_tickets_service,
                                      update_ticket_service)
 
 bp = Blueprint("tickets", __name__)
@@ -33,10 +37,12 @@ def home():
     search = request.args.get("search", "").strip()
     filter_status = request.args.get("filter_status")
     sort_by = request.args.get("sort_by")
+    sort_dir = request.args.get("sort_dir")
 
     tickets = list_tickets_service(
         filter_status=filter_status,
         sort_by=sort_by,
+        sort_dir=sort_dir,
         search=search,
         page=page,
         per_page=per_page,
@@ -52,10 +58,21 @@ def home():
         search=search,
         filter_status=filter_status,
         sort_by=sort_by,
+        sort_dir=sort_dir,
         STATUSES=STATUSES,
     )
 
 
+# -------------------------
+# Search Suggestions (typeahead)
+# -------------------------
+@bp.route("/suggest")
+def suggest_route():
+    prefix = request.args.get("q", "").strip()
+    limit = request.args.get("limit", type=int)
+    return jsonify(suggestions=suggest_tickets_service(prefix, limit))
+
+
 # -------------------------
 # Create Ticket
 # -------------------------
@@ -133,3 +150,34 @@ def delete_ticket_route(ticket_id):
     else:
         flash("Ticket not found!", "danger")
     return redirect(url_for("tickets.home"))
+
+
+# -------------------------
+# Claim / Release Ticket
+# -------------------------
+@bp.route("/claim", methods=["POST"])
+def claim_ticket_route():
+    assignee = request.form.get("assignee", "").strip()
+    success, result = claim_next_ticket_service(assignee)
+    if not success:
+        for e in result:
+            flash(e, "danger")
+        return redirect(url_for("tickets.home"))
+    if result is None:
+        flash("No open tickets to claim.", "info")
+        return redirect(url_for("tickets.home"))
+
+    flash(f"Ticket #{result.id} claimed by {assignee}.", "success")
+    return redirect(url_for("tickets.update_ticket_route", ticket_id=result.id))
+
+
+@bp.route("/release/<int:ticket_id>", methods=["POST"])
+def release_ticket_route(ticket_id):
+    assignee = request.form.get("assignee", "").strip()
+    success, errors = release_ticket_service(ticket_id, assignee)
+    if success:
+        flash("Ticket returned to the queue.", "success")
+    else:
+        for e in errors:
+            flash(e, "danger")
+    return redirect(url_for("tickets.home"))
@@ -1,30 +1,55 @@
 # services/ticket_service.py
+import asyncio
 from typing import Any, List, Optional, Tuple
 
-from database import db_session
-from models.ticket import (count_tickets, create_ticket, delete_ticket,
-                           get_ticket, list_tickets, update_ticket)
+from cache import forget_generation, get_cache
+from database import db_session, get_db_executor
+from flask import current_app
 from models.ticket_model import PRIORITIES, STATUSES
-from validators import validate_ticket
+from validators import (validate_assignee, validate_lease_seconds,
+                        validate_ticket)
 
 # -------------------------
 # Ticket Service Helpers
 # -------------------------
 
 
-def handle_db_operation(func, *args, **kwargs) -> Tuple[bool, Optional[List[str]]]:
+def handle_db_operation(
+    operation: str, *args, **kwargs
+) -> Tuple[bool, Optional[List[str]]]:
     """
-    Executes a database operation safely within a session.
+    Executes a storage backend write (by method name) safely within a session.
     Returns (success: bool, errors: list or None)
     """
     try:
-        with db_session() as conn:
-            result = func(conn, *args, **kwargs)
+        with db_session() as backend:
+            result = getattr(backend, operation)(*args, **kwargs)
+        forget_generation()
         return True, result if result is not None else None
     except Exception as e:
         return False, [str(e)]
 
 
+# -------------------------
+# Write Hooks
+# -------------------------
+def register_write_hook(app, hook) -> None:
+    """
+    Registers hook(event, ticket_id) to run after every successful write made
+    through this module; event is "create", "update" or "delete".
+    """
+    app.extensions.setdefault("ticket_write_hooks", []).append(hook)
+
+
+def notify_write(event: str, ticket_id: int) -> None:
+    """Runs the app's write hooks. A failing hook is logged, never raised."""
+    for hook in current_app.extensions.get("ticket_write_hooks", ()):
+        try:
+            hook(event, ticket_id)
+        except Exception:
+            current_app.logger.exception("Ticket write hook %r failed", hook)
+
+
 # -------------------------
 # Create Ticket
 # -------------------------
@@ -39,7 +64,10 @@ def create_ticket_service(
     if errors:
         return False, errors
 
-    return handle_db_operation(create_ticket, title, description, priority)
+    success, result = handle_db_operation("create_ticket", title, description, priority)
+    if success:
+        notify_write("create", result)
+    return success, result
 
 
 # -------------------------
@@ -58,9 +86,12 @@ def update_ticket_service(
     if errors:
         return False, errors
 
-    return handle_db_operation(
-        update_ticket, ticket_id, title, description, priority, status
+    success, result = handle_db_operation(
+        "update_ticket", ticket_id, title, description, priority, status
     )
+    if success and result:
+        notify_write("update", ticket_id)
+    return success, result
 
 
 # -------------------------
@@ -71,7 +102,43 @@ def delete_ticket_service(ticket_id: int) -> Tuple[bool, Optional[List[str]]]:
     Deletes a ticket by ID.
     Returns (success: bool, errors: list or None)
     """
-    return handle_db_operation(delete_ticket, ticket_id)
+    success, result = handle_db_operation("delete_ticket", ticket_id)
+    if success and result:
+        notify_write("delete", ticket_id)
+    return success, result
+
+
+# -------------------------
+# Claim / Release (agent work queue)
+# -------------------------
+def claim_next_ticket_service(
+    assignee: str, lease_seconds: Optional[int] = None
+) -> Tuple[bool, Any]:
+    """
+    Atomically claims the most urgent, oldest unassigned Open ticket.
+    Returns (True, ticket), (True, None) when the queue is empty,
+    or (False, errors).
+    """
+    if lease_seconds is None:
+        lease_seconds = current_app.config.get("CLAIM_LEASE_SECONDS", 900)
+    errors = validate_assignee(assignee) + validate_lease_seconds(lease_seconds)
+    if errors:
+        return False, errors
+
+    return handle_db_operation("claim_next_ticket", assignee, lease_seconds)
+
+
+def release_ticket_service(
+    ticket_id: int, assignee: str
+) -> Tuple[bool, Optional[List[str]]]:
+    """
+    Returns a claimed ticket to the queue. Only its current assignee may release it.
+    Returns (success: bool, errors: list or None)
+    """
+    success, result = handle_db_operation("release_ticket", ticket_id, assignee)
+    if success and not result:
+        return False, ["Ticket is not claimed by you."]
+    return success, result
 
 
 # -------------------------
@@ -82,8 +149,8 @@ def get_ticket_service(ticket_id: int) -> Any:
     Retrieves a single ticket by ID.
     Returns ticket row or None.
     """
-    with db_session() as conn:
-        return get_ticket(conn, ticket_id)
+    with db_session() as backend:
+        return backend.get_ticket(ticket_id)
 
 
 # -------------------------
@@ -95,22 +162,39 @@ def list_tickets_service(
     search: Optional[str] = None,
     page: int = 1,
     per_page: int = 10,
+    sort_dir: Optional[str] = None,
 ):
     """
     Retrieves a paginated list of tickets with optional filters and sorting.
     """
     offset = (page - 1) * per_page
-    with db_session() as conn:
-        return list_tickets(
-            conn,
+    with db_session() as backend:
+        return backend.list_tickets(
             filter_status=filter_status,
             sort_by=sort_by,
             search=search,
             offset=offset,
             limit=per_page,
+            sort_dir=sort_dir,
         )
 
 
+# -------------------------
+# Typeahead Suggestions
+# -------------------------
+def suggest_tickets_service(prefix: str, limit: Optional[int] = None) -> List[dict]:
+    """
+    Returns up to limit {"id", "title"} suggestions for a search-box prefix,
+    newest first. The limit defaults to SUGGEST_LIMIT and is capped at 20.
+    """
+    if limit is None:
+        limit = current_app.config.get("SUGGEST_LIMIT", 8)
+    limit = min(max(limit, 0), 20)
+    with db_session() as backend:
+        pairs = backend.suggest_titles(prefix[:100], limit)
+    return [{"id": tid, "title": title} for tid, title in pairs]
+
+
 # -------------------------
 # Count Tickets
 # -------------------------
@@ -119,6 +203,95 @@ def count_tickets_service(
 ) -> int:
     """
     Returns total number of tickets matching optional filters.
+    Cached per process until any worker writes a ticket.
     """
-    with db_session() as conn:
-        return count_tickets(conn, filter_status=filter_status, search=search)
+
+    def count():
+        with db_session() as backend:
+            return backend.count_tickets(filter_status=filter_status, search=search)
+
+    return get_cache("ticket_counts").get(
+        (filter_status or None, search or None), count
+    )
+
+
+# -------------------------
+# Async Variants
+# -------------------------
+async def run_in_db_executor(func, *args, **kwargs):
+    """
+    Runs a blocking service call on the app's bounded DB executor.
+    Each call gets its own app context (and therefore its own connection).
+    """
+    app = current_app._get_current_object()
+    loop = asyncio.get_running_loop()
+
+    def call():
+        with app.app_context():
+            return func(*args, **kwargs)
+
+    return await loop.run_in_executor(get_db_executor(app), call)
+
+
+async def create_ticket_service_async(
+    title: str, description: str, priority: str
+) -> Tuple[bool, Optional[List[str]]]:
+    """Async variant of create_ticket_service."""
+    return await run_in_db_executor(create_ticket_service, title, description, priority)
+
+
+async def update_ticket_service_async(
+    ticket_id: int, title: str, description: str, priority: str, status: str
+) -> Tuple[bool, Optional[List[str]]]:
+    """Async variant of update_ticket_service."""
+    return await run_in_db_executor(
+        update_ticket_service, ticket_id, title, description, priority, status
+    )
+
+
+async def delete_ticket_service_async(
+    ticket_id: int,
+) -> Tuple[bool, Optional[List[str]]]:
+    """Async variant of delete_ticket_service."""
+    return await run_in_db_executor(delete_ticket_service, ticket_id)
+
+
+async def claim_next_ticket_service_async(
+    assignee: str, lease_seconds: Optional[int] = None
+) -> Tuple[bool, Any]:
+    """Async variant of claim_next_ticket_service."""
+    return await run_in_db_executor(claim_next_ticket_service, assignee, lease_seconds)
+
+
+async def get_ticket_service_async(ticket_id: int) -> Any:
+    """Async variant of get_ticket_service."""
+    return await run_in_db_executor(get_ticket_service, ticket_id)
+
+
+async def list_tickets_service_async(
+    filter_status: Optional[str] = None,
+    sort_by: Optional[str] = None,
+    search: Optional[str] = None,
+    page: int = 1,
+    per_page: int = 10,
+    sort_dir: Optional[str] = None,
+):
+    """Async variant of list_tickets_service."""
+    return await run_in_db_executor(
+        list_tickets_service,
+        filter_status=filter_status,
+        sort_by=sort_by,
+        search=search,
+        page=page,
+        per_page=per_page,
+        sort_dir=sort_dir,
+    )
+
+
+async def count_tickets_service_async(
+    filter_status: Optional[str] = None, search: Optional[str] = None
+) -> int:
+    """Async variant of count_tickets_service."""
+    return await run_in_db_executor(
+        count_tickets_service, filter_status=filter_status, search=search
+    )
@@ -0,0 +1,217 @@
+"""SLA breach detection with an in-process timer heap.
+
+A ticket breaches its SLA when it is still Open / In Progress
+``SLA_SECONDS[priority]`` seconds after it was created. Instead of re-scanning
+the table, :class:`SLAScheduler` loads the unescalated active tickets once
+(walking ``idx_tickets_status_created_at``), keeps their deadlines in a
+min-heap, and keeps that heap current from the ticket service write hooks. A
+single thread sleeps until the earliest deadline and escalates exactly the
+tickets that are due.
+
+Escalation is recorded in ``tickets.escalated_at`` by a conditional UPDATE, so
+it happens once even with several workers running a scheduler, and after a
+restart the heap is rebuilt from the database: breaches that happened while
+the app was down fire immediately, already escalated tickets never fire again.
+An escalation that fails (e.g. ``database is locked``) is logged and retried
+``retry_delay`` seconds later; the scheduler thread keeps running.
+"""
+
+import heapq
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+from database import SLA_STATUSES, db_session
+from services.ticket_service import register_write_hook
+
+
+def parse_timestamp(value: str) -> float:
+    """Epoch seconds for a SQLite CURRENT_TIMESTAMP string (UTC)."""
+    moment = datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+    return moment.replace(tzinfo=timezone.utc).timestamp()
+
+
+class SLAScheduler:
+    """Fires SLA escalations from a heap of (deadline, ticket_id)."""
+
+    def __init__(
+        self,
+        app,
+        sla_seconds: Dict[str, int],
+        on_escalate: Optional[Callable] = None,
+        clock: Callable[[], float] = time.time,
+        retry_delay: float = 5.0,
+    ):
+        self.app = app
+        self.sla_seconds = dict(sla_seconds)
+        self.on_escalate = on_escalate or self._log_escalation
+        self.clock = clock
+        self.retry_delay = retry_delay
+        self._heap: List[Tuple[float, int]] = []
+        # ticket_id -> live deadline; heap entries that disagree are stale
+        self._deadlines: Dict[int, float] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    # -------------------------
+    # Heap maintenance
+    # -------------------------
+    def _deadline(self, priority: str, created_at: str) -> Optional[float]:
+        sla = self.sla_seconds.get(priority)
+        return None if sla is None else parse_timestamp(created_at) + sla
+
+    def schedule(self, ticket_id: int, priority: str, status: str, created_at: str):
+        """(Re)schedule a ticket, or drop it if it is no longer on the clock."""
+        deadline = self._deadline(priority, created_at)
+        with self._cond:
+            if status not in SLA_STATUSES or deadline is None:
+                self._deadlines.pop(ticket_id, None)
+                return
+            if self._deadlines.get(ticket_id) == deadline:
+                return
+            self._deadlines[ticket_id] = deadline
+            heapq.heappush(self._heap, (deadline, ticket_id))
+            self._cond.notify()
+
+    def unschedule(self, ticket_id: int):
+        with self._cond:
+            self._deadlines.pop(ticket_id, None)
+
+    def load(self):
+        """Rebuild the heap from the database (startup / recovery)."""
+        with self.app.app_context():
+            with db_session() as backend:
+                rows = backend.sla_candidates(SLA_STATUSES)
+        deadlines = {}
+        for ticket_id, priority, _, created_at in rows:
+            deadline = self._deadline(priority, created_at)
+            if deadline is not None:
+                deadlines[ticket_id] = deadline
+        with self._cond:
+            self._deadlines = deadlines
+            self._heap = [(d, tid) for tid, d in deadlines.items()]
+            heapq.heapify(self._heap)
+            self._cond.notify()
+
+    def on_write(self, event: str, ticket_id: int):
+        """Ticket service write hook; runs inside the writing request."""
+        if event == "delete":
+            self.unschedule(ticket_id)
+            return
+        with db_session() as backend:
+            ticket = backend.get_ticket(ticket_id)
+        if ticket is None or ticket.escalated_at:
+            self.unschedule(ticket_id)
+        else:
+            self.schedule(ticket.id, ticket.priority, ticket.status, ticket.created_at)
+
+    def _peek(self) -> Optional[float]:
+        """Earliest live deadline, discarding stale heap entries. Needs the lock."""
+        while self._heap:
+            deadline, ticket_id = self._heap[0]
+            if self._deadlines.get(ticket_id) == deadline:
+                return deadline
+            heapq.heappop(self._heap)
+        return None
+
+    def next_deadline(self) -> Optional[float]:
+        with self._cond:
+            return self._peek()
+
+    # -------------------------
+    # Firing
+    # -------------------------
+    def run_pending(self) -> List[int]:
+        """Escalate every ticket whose deadline has passed. Returns their ids."""
+        now = self.clock()
+        due = []
+        with self._cond:
+            while self._peek() is not None and self._heap[0][0] <= now:
+                _, ticket_id = heapq.heappop(self._heap)
+                del self._deadlines[ticket_id]
+                due.append(ticket_id)
+
+        escalated = []
+        for ticket_id in due:
+            with self.app.app_context():
+                try:
+                    with db_session() as backend:
+                        fired = backend.escalate_ticket(ticket_id, SLA_STATUSES)
+                        ticket = backend.get_ticket(ticket_id) if fired else None
+                except Exception:
+                    self.app.logger.exception(
+                        "SLA escalation of ticket #%s failed, retrying in %ss",
+                        ticket_id,
+                        self.retry_delay,
+                    )
+                    self._retry(ticket_id, now + self.retry_delay)
+                    continue
+                if ticket is None:
+                    continue
+                escalated.append(ticket_id)
+                try:
+                    self.on_escalate(ticket)
+                except Exception:
+                    self.app.logger.exception("SLA escalation hook failed")
+        return escalated
+
+    def _retry(self, ticket_id: int, deadline: float):
+        with self._cond:
+            # A write hook may have rescheduled or dropped it meanwhile
+            if ticket_id in self._deadlines:
+                return
+            self._deadlines[ticket_id] = deadline
+            heapq.heappush(self._heap, (deadline, ticket_id))
+
+    def _log_escalation(self, ticket):
+        self.app.logger.warning(
+            "SLA breached: ticket #%s (%s priority, %s) created %s",
+            ticket.id,
+            ticket.priority,
+            ticket.status,
+            ticket.created_at,
+        )
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if self._stopped:
+                    return
+                deadline = self._peek()
+                timeout = None if deadline is None else deadline - self.clock()
+                if timeout is None or timeout > 0:
+                    self._cond.wait(timeout)
+                if self._stopped:
+                    return
+            try:
+                self.run_pending()
+            except Exception:
+                self.app.logger.exception("SLA scheduler pass failed")
+                time.sleep(self.retry_delay)
+
+    def start(self):
+        self.load()
+        self._thread = threading.Thread(
+            target=self._run, name="sla-scheduler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        if self._thread:
+            self._thread.join()
+
+
+def init_sla_scheduler(app) -> Optional[SLAScheduler]:
+    """Start the SLA scheduler for ``app`` when ``SLA_SCHEDULER_ENABLED`` is set."""
+    if not app.config.get("SLA_SCHEDULER_ENABLED"):
+        return None
+    scheduler = SLAScheduler(app, app.config["SLA_SECONDS"])
+    register_write_hook(app, scheduler.on_write)
+    app.extensions["sla_scheduler"] = scheduler
+    scheduler.start()
+    return scheduler
@@ -0,0 +1,122 @@
+# storage/base.py
+"""Storage backend interface shared by every ticket store.
+
+Services talk to a :class:`TicketBackend` rather than to a raw ``sqlite3``
+connection, so the same service/route code runs on top of the SQLite file
+database or the ephemeral in-memory engine.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Sequence, Tuple
+
+# Columns the list view may be ordered by. Anything else falls back to the
+# natural (id) order. Ties are always broken on id in the same direction.
+SORTABLE_COLUMNS = ("priority", "status", "created_at")
+SORT_DIRECTIONS = ("asc", "desc")
+
+
+class TicketBackend(ABC):
+    """CRUD + query contract implemented by every storage backend."""
+
+    name = "abstract"
+
+    # -------------------------
+    # Writes
+    # -------------------------
+    @abstractmethod
+    def create_ticket(self, title: str, description: str, priority: str) -> int:
+        """Insert a new ticket with status 'Open'. Returns the new ticket ID."""
+
+    @abstractmethod
+    def update_ticket(
+        self, ticket_id: int, title: str, description: str, priority: str, status: str
+    ) -> int:
+        """Update an existing ticket. Returns the number of rows affected."""
+
+    @abstractmethod
+    def delete_ticket(self, ticket_id: int) -> int:
+        """Delete a ticket by ID. Returns the number of rows affected."""
+
+    @abstractmethod
+    def claim_next_ticket(self, assignee: str, lease_seconds: int) -> Any:
+        """Atomically lease the most urgent, oldest claimable Open ticket.
+
+        A ticket is claimable when unassigned or its lease has expired.
+        Returns the claimed ticket, or None when the queue is empty.
+        """
+
+    @abstractmethod
+    def release_ticket(self, ticket_id: int, assignee: str) -> int:
+        """Return a ticket held by ``assignee`` to the queue. Returns rows affected."""
+
+    @abstractmethod
+    def escalate_ticket(self, ticket_id: int, statuses: Sequence[str]) -> int:
+        """Mark a ticket escalated if still in ``statuses`` and not yet escalated.
+
+        Returns 1 when this call escalated it, 0 otherwise.
+        """
+
+    # -------------------------
+    # Reads
+    # -------------------------
+    @abstractmethod
+    def sla_candidates(
+        self, statuses: Sequence[str]
+    ) -> List[Tuple[int, str, str, str]]:
+        """Return (id, priority, status, created_at) of unescalated tickets in ``statuses``."""
+
+    @abstractmethod
+    def suggest_titles(self, prefix: str, limit: int = 8) -> List[Tuple[int, str]]:
+        """Return up to ``limit`` (id, title) pairs, newest first, for a typeahead.
+
+        A ticket matches when every word of ``prefix`` is the start of some
+        word of its title (case-insensitive).
+        """
+
+    @abstractmethod
+    def generation(self) -> int:
+        """Return a counter that changes whenever any ticket changes.
+
+        For shared backends the value is visible to every process, so it can
+        validate process-local caches.
+        """
+
+    @abstractmethod
+    def get_ticket(self, ticket_id: int) -> Any:
+        """Return a single ticket (attribute access) or None."""
+
+    @abstractmethod
+    def list_tickets(
+        self,
+        filter_status: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        search: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 10,
+        sort_dir: Optional[str] = None,
+    ) -> List[Any]:
+        """Return a page of tickets with optional filtering, search and sorting.
+
+        Priority sorts by rank (most urgent first); ``sort_dir="desc"`` reverses
+        the order including the id tie-breaker. Rows are summaries: they carry
+        ``description_preview`` (at most ``DESCRIPTION_PREVIEW_LENGTH``
+        characters) instead of ``description``.
+        """
+
+    @abstractmethod
+    def count_tickets(
+        self, filter_status: Optional[str] = None, search: Optional[str] = None
+    ) -> int:
+        """Return the number of tickets matching the optional filters."""
+
+    # -------------------------
+    # Session hooks
+    # -------------------------
+    def commit(self) -> None:
+        """Make pending writes durable. No-op for auto-committing backends."""
+
+    def rollback(self) -> None:
+        """Discard pending writes. No-op for auto-committing backends."""
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
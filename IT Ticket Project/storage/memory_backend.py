@@ -0,0 +1,325 @@
+# storage/memory_backend.py
+"""Pure in-memory implementation of :class:`storage.base.TicketBackend`.
+
+Intended for ephemeral, high-throughput deployments and fast tests. Records
+live in a dict keyed by id; sorted secondary indexes on ``status``,
+``priority`` and ``created_at`` let filtered and sorted page requests walk only
+the rows they return instead of sorting the whole table on every call. A
+sorted (token, id) list over title words serves typeahead prefix lookups.
+"""
+
+import heapq
+import threading
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from database import (
+    DESCRIPTION_PREVIEW_LENGTH,
+    ascii_lower,
+    priority_rank,
+    title_tokens,
+)
+from storage.base import SORTABLE_COLUMNS, TicketBackend
+
+# index name -> sort key. Priority is indexed by rank, matching the SQLite
+# backend's priority_rank column; status_priority mirrors the composite
+# (status, priority_rank) index used for filtered priority sorts and claims.
+INDEX_KEYS = {
+    "status": lambda row: row["status"],
+    "priority": lambda row: priority_rank(row["priority"]),
+    "created_at": lambda row: row["created_at"],
+    "status_priority": lambda row: (row["status"], priority_rank(row["priority"])),
+}
+
+
+def _now(offset_seconds: int = 0) -> str:
+    """UTC timestamp in the same format as SQLite's CURRENT_TIMESTAMP."""
+    moment = datetime.now(timezone.utc) + timedelta(seconds=offset_seconds)
+    return moment.strftime("%Y-%m-%d %H:%M:%S")
+
+
+class MemoryBackend(TicketBackend):
+    """Thread-safe ticket store held entirely in process memory.
+
+    One instance is shared by every request of an app, so ``commit`` and
+    ``rollback`` are no-ops: each operation is applied atomically under a lock.
+    """
+
+    name = "memory"
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._rows: Dict[int, Dict[str, Any]] = {}
+        # index name -> sorted list of (key, id)
+        self._indexes: Dict[str, List[Tuple[Any, int]]] = {
+            col: [] for col in INDEX_KEYS
+        }
+        # sorted (title token, id): a prefix is one contiguous range
+        self._title_index: List[Tuple[str, int]] = []
+        self._next_id = 1
+        # Bumped by every successful write, like the SQLite triggers
+        self._generation = 0
+
+    # -------------------------
+    # Index maintenance
+    # -------------------------
+    def _index_add(self, row: Dict[str, Any]) -> None:
+        for col, index in self._indexes.items():
+            insort(index, (INDEX_KEYS[col](row), row["id"]))
+        for token in set(title_tokens(row["title"])):
+            insort(self._title_index, (token, row["id"]))
+
+    def _index_remove(self, row: Dict[str, Any]) -> None:
+        for col, index in self._indexes.items():
+            key = (INDEX_KEYS[col](row), row["id"])
+            pos = bisect_left(index, key)
+            if pos < len(index) and index[pos] == key:
+                del index[pos]
+        for token in set(title_tokens(row["title"])):
+            key = (token, row["id"])
+            pos = bisect_left(self._title_index, key)
+            if pos < len(self._title_index) and self._title_index[pos] == key:
+                del self._title_index[pos]
+
+    def _status_range(self, status: str) -> Tuple[int, int]:
+        index = self._indexes["status"]
+        lo = bisect_left(index, (status,))
+        hi = bisect_left(index, (status, float("inf")))
+        return lo, hi
+
+    def _status_priority_ids(
+        self, status: str, descending: bool = False
+    ) -> Iterator[int]:
+        """Ids of one status ordered by (priority rank, id), walked in place."""
+        index = self._indexes["status_priority"]
+        lo = bisect_left(index, ((status, -1),))
+        hi = bisect_left(index, ((status, float("inf")),))
+        positions = range(hi - 1, lo - 1, -1) if descending else range(lo, hi)
+        return (index[i][1] for i in positions)
+
+    # -------------------------
+    # Query helpers
+    # -------------------------
+    @staticmethod
+    def _summary(row: Dict[str, Any]) -> SimpleNamespace:
+        """List-view projection, matching the SQLite backend's LIST_COLUMNS."""
+        return SimpleNamespace(
+            id=row["id"],
+            title=row["title"],
+            description_preview=row["description"][:DESCRIPTION_PREVIEW_LENGTH],
+            priority=row["priority"],
+            status=row["status"],
+            assignee=row["assignee"],
+            escalated_at=row["escalated_at"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
+
+    @staticmethod
+    def _matches(row: Dict[str, Any], needle: Optional[str]) -> bool:
+        # Mirrors SQLite's LIKE '%needle%': literal, ASCII-only case folding
+        if not needle:
+            return True
+        return needle in ascii_lower(row["title"]) or needle in ascii_lower(
+            row["description"]
+        )
+
+    def _candidate_ids(
+        self,
+        filter_status: Optional[str],
+        sort_by: Optional[str],
+        descending: bool = False,
+    ) -> Iterator[int]:
+        """Yield ids in result order, using the narrowest index available."""
+        if sort_by == "priority" and filter_status:
+            return self._status_priority_ids(filter_status, descending)
+        if sort_by in SORTABLE_COLUMNS and sort_by != "status":
+            index = self._indexes[sort_by]
+            entries = reversed(index) if descending else iter(index)
+            ids = (tid for _, tid in entries)
+            if filter_status:
+                return (
+                    tid for tid in ids if self._rows[tid]["status"] == filter_status
+                )
+            return ids
+        if sort_by == "status" and not filter_status:
+            index = self._indexes["status"]
+            entries = reversed(index) if descending else iter(index)
+            return (tid for _, tid in entries)
+        if filter_status:
+            # Entries within one status are in id order
+            lo, hi = self._status_range(filter_status)
+            entries = self._indexes["status"][lo:hi]
+            if sort_by == "status" and descending:
+                entries.reverse()
+            return (tid for _, tid in entries)
+        return iter(self._rows)
+
+    # -------------------------
+    # Writes
+    # -------------------------
+    def create_ticket(self, title: str, description: str, priority: str) -> int:
+        with self._lock:
+            ticket_id = self._next_id
+            self._next_id += 1
+            now = _now()
+            row = {
+                "id": ticket_id,
+                "title": title,
+                "description": description,
+                "priority": priority,
+                "status": "Open",
+                "assignee": None,
+                "lease_expires_at": None,
+                "escalated_at": None,
+                "created_at": now,
+                "updated_at": now,
+            }
+            self._rows[ticket_id] = row
+            self._index_add(row)
+            self._generation += 1
+            return ticket_id
+
+    def update_ticket(
+        self, ticket_id: int, title: str, description: str, priority: str, status: str
+    ) -> int:
+        with self._lock:
+            row = self._rows.get(ticket_id)
+            if row is None:
+                return 0
+            self._index_remove(row)
+            row.update(
+                title=title,
+                description=description,
+                priority=priority,
+                status=status,
+                updated_at=_now(),
+            )
+            self._index_add(row)
+            self._generation += 1
+            return 1
+
+    def delete_ticket(self, ticket_id: int) -> int:
+        with self._lock:
+            row = self._rows.pop(ticket_id, None)
+            if row is None:
+                return 0
+            self._index_remove(row)
+            self._generation += 1
+            return 1
+
+    def claim_next_ticket(self, assignee: str, lease_seconds: int) -> Any:
+        with self._lock:
+            now = _now()
+            # Open tickets by (rank, id): most urgent, then oldest
+            for tid in self._status_priority_ids("Open"):
+                row = self._rows[tid]
+                if row["assignee"] is not None and row["lease_expires_at"] > now:
+                    continue
+                row.update(
+                    assignee=assignee,
+                    lease_expires_at=_now(lease_seconds),
+                    updated_at=now,
+                )
+                self._generation += 1
+                return SimpleNamespace(**row)
+            return None
+
+    def release_ticket(self, ticket_id: int, assignee: str) -> int:
+        with self._lock:
+            row = self._rows.get(ticket_id)
+            if row is None or row["assignee"] != assignee:
+                return 0
+            row.update(assignee=None, lease_expires_at=None, updated_at=_now())
+            self._generation += 1
+            return 1
+
+    def escalate_ticket(self, ticket_id: int, statuses: Sequence[str]) -> int:
+        with self._lock:
+            row = self._rows.get(ticket_id)
+            if row is None or row["escalated_at"] or row["status"] not in statuses:
+                return 0
+            row["escalated_at"] = _now()
+            self._generation += 1
+            return 1
+
+    # -------------------------
+    # Reads
+    # -------------------------
+    def sla_candidates(
+        self, statuses: Sequence[str]
+    ) -> List[Tuple[int, str, str, str]]:
+        with self._lock:
+            result = []
+            for status in statuses:
+                lo, hi = self._status_range(status)
+                for _, tid in self._indexes["status"][lo:hi]:
+                    row = self._rows[tid]
+                    if not row["escalated_at"]:
+                        result.append(
+                            (tid, row["priority"], row["status"], row["created_at"])
+                        )
+            return result
+
+    def suggest_titles(self, prefix: str, limit: int = 8) -> List[Tuple[int, str]]:
+        tokens = title_tokens(prefix)
+        if not tokens or limit <= 0:
+            return []
+        with self._lock:
+            matches = None
+            for token in tokens:
+                lo = bisect_left(self._title_index, (token,))
+                hi = bisect_left(self._title_index, (token + "\U0010ffff",))
+                ids = {tid for _, tid in self._title_index[lo:hi]}
+                matches = ids if matches is None else matches & ids
+            return [
+                (tid, self._rows[tid]["title"])
+                for tid in heapq.nlargest(limit, matches)
+            ]
+
+    def generation(self) -> int:
+        return self._generation
+
+    def get_ticket(self, ticket_id: int) -> Any:
+        with self._lock:
+            row = self._rows.get(ticket_id)
+            return SimpleNamespace(**row) if row else None
+
+    def list_tickets(
+        self,
+        filter_status: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        search: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 10,
+        sort_dir: Optional[str] = None,
+    ) -> List[Any]:
+        needle = ascii_lower(search) if search else None
+        descending = sort_dir == "desc"
+        with self._lock:
+            rows = (
+                self._rows[tid]
+                for tid in self._candidate_ids(filter_status, sort_by, descending)
+            )
+            if needle:
+                rows = (r for r in rows if self._matches(r, needle))
+            # SQLite treats a negative OFFSET as 0 and a negative LIMIT as "no limit"
+            start = max(offset, 0)
+            stop = start + limit if limit >= 0 else None
+            return [self._summary(r) for r in islice(rows, start, stop)]
+
+    def count_tickets(
+        self, filter_status: Optional[str] = None, search: Optional[str] = None
+    ) -> int:
+        needle = ascii_lower(search) if search else None
+        with self._lock:
+            if not needle:
+                if not filter_status:
+                    return len(self._rows)
+                lo, hi = self._status_range(filter_status)
+                return hi - lo
+            ids = self._candidate_ids(filter_status, None)
+            return sum(1 for tid in ids if self._matches(self._rows[tid], needle))
@@ -0,0 +1,92 @@
+# storage/sqlite_backend.py
+"""SQLite implementation of :class:`storage.base.TicketBackend`.
+
+A thin adapter over the SQL in ``models.ticket`` so there is exactly one copy
+of the queries.
+"""
+
+import sqlite3
+from typing import Any, List, Optional, Sequence, Tuple
+
+from models import ticket as ticket_model
+from storage.base import TicketBackend
+
+
+class SQLiteBackend(TicketBackend):
+    """Ticket store backed by a ``sqlite3`` connection."""
+
+    name = "sqlite"
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def create_ticket(self, title: str, description: str, priority: str) -> int:
+        return ticket_model.create_ticket(self.conn, title, description, priority)
+
+    def update_ticket(
+        self, ticket_id: int, title: str, description: str, priority: str, status: str
+    ) -> int:
+        return ticket_model.update_ticket(
+            self.conn, ticket_id, title, description, priority, status
+        )
+
+    def delete_ticket(self, ticket_id: int) -> int:
+        return ticket_model.delete_ticket(self.conn, ticket_id)
+
+    def claim_next_ticket(self, assignee: str, lease_seconds: int) -> Any:
+        return ticket_model.claim_next_ticket(self.conn, assignee, lease_seconds)
+
+    def release_ticket(self, ticket_id: int, assignee: str) -> int:
+        return ticket_model.release_ticket(self.conn, ticket_id, assignee)
+
+    def escalate_ticket(self, ticket_id: int, statuses: Sequence[str]) -> int:
+        return ticket_model.escalate_ticket(self.conn, ticket_id, statuses)
+
+    def sla_candidates(
+        self, statuses: Sequence[str]
+    ) -> List[Tuple[int, str, str, str]]:
+        return ticket_model.sla_candidates(self.conn, statuses)
+
+    def suggest_titles(self, prefix: str, limit: int = 8) -> List[Tuple[int, str]]:
+        return ticket_model.suggest_titles(self.conn, prefix, limit)
+
+    def generation(self) -> int:
+        return ticket_model.get_generation(self.conn)
+
+    def get_ticket(self, ticket_id: int) -> Any:
+        return ticket_model.get_ticket(self.conn, ticket_id)
+
+    def list_tickets(
+        self,
+        filter_status: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        search: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 10,
+        sort_dir: Optional[str] = None,
+    ) -> List[Any]:
+        return ticket_model.list_tickets(
+            self.conn,
+            filter_status=filter_status,
+            sort_by=sort_by,
+            search=search,
+            offset=offset,
+            limit=limit,
+            sort_dir=sort_dir,
+        )
+
+    def count_tickets(
+        self, filter_status: Optional[str] = None, search: Optional[str] = None
+    ) -> int:
+        return ticket_model.count_tickets(
+            self.conn, filter_status=filter_status, search=search
+        )
+
+    def commit(self) -> None:
+        self.conn.commit()
+
+    def rollback(self) -> None:
+        self.conn.rollback()
+
+    def close(self) -> None:
+        self.conn.close()
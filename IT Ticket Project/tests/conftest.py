@@ -0,0 +1,47 @@
+"""Fixtures shared by the route-level tests.
+
+``app`` runs each test once per storage backend. A module can add config by
+overriding the ``app_config`` fixture.
+"""
+
+import pytest
+from ticketing_app import create_app
+
+
+@pytest.fixture
+def app_config():
+    return {}
+
+
+@pytest.fixture(params=["sqlite", "memory"])
+def app(request, tmp_path, app_config):
+    return create_app(
+        {
+            "TESTING": True,
+            "DATABASE_PATH": str(tmp_path / "tickets.db"),
+            "STORAGE_BACKEND": request.param,
+            **app_config,
+        }
+    )
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def _create_ticket(client, title="Server down", priority="High"):
+    return client.post(
+        "/create",
+        data={
+            "title": title,
+            "description": "Main server is down",
+            "priority": priority,
+        },
+    )
+
+
+@pytest.fixture
+def create_ticket():
+    """``create_ticket(client, title, priority)``: POST a valid /create form."""
+    return _create_ticket
@@ -1,173 +1,84 @@
+"""Connection-style wrappers over :class:`storage.sqlite_backend.SQLiteBackend`.
+
+The legacy tests call ``create_ticket_db(..., conn)`` style functions on a raw
+``sqlite3`` connection. These helpers keep that calling convention but run the
+app's own schema and queries, so there is no second copy of the CRUD code.
+"""
+
 import sqlite3
-from datetime import datetime
 
-VALID_UPDATE_COLUMNS = {"title", "description", "priority", "status", "updated_at"}
+import database
+from storage.sqlite_backend import SQLiteBackend
 
+SORT_ALIASES = {"date": "created_at"}
 
-def get_connection(path=":memory:"):
-    conn = sqlite3.connect(path)
-    return conn
 
+def _backend(conn):
+    return SQLiteBackend(conn)
 
-def setup_db(conn):
-    cursor = conn.cursor()
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS tickets (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            description TEXT,
-            priority TEXT,
-            status TEXT,
-            created_at TEXT,
-            updated_at TEXT
-        )
-    """
+
+def _row(ticket):
+    """(id, title, description, priority, status, created_at, updated_at)"""
+    return (
+        ticket.id,
+        ticket.title,
+        ticket.description,
+        ticket.priority,
+        ticket.status,
+        ticket.created_at,
+        ticket.updated_at,
     )
-    conn.commit()
 
 
-def _create_ticket_db(
-    title, description, priority, status, created_at, updated_at, conn
-):
-    cursor = conn.cursor()
-    cursor.execute(
-        """
-        INSERT INTO tickets (title, description, priority, status, created_at, updated_at)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """,
-        (title, description, priority, status, created_at, updated_at),
-    )
-    conn.commit()
-    return cursor.lastrowid
+def get_connection(path=":memory:"):
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    return conn
 
 
-def create_ticket_db(title, description, priority, *args):
-    # Compatibility wrapper preserved for tests
-    # Legacy call: create_ticket_db(title, description, priority, conn)
-    if len(args) == 1:
-        conn = args[0]
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        return _create_ticket_db(title, description, priority, "Open", now, now, conn)
+def setup_db(conn):
+    conn.row_factory = sqlite3.Row
+    database.setup_db(conn)
 
-    # New-style call: create_ticket_db(title, description, priority, status, created_at, updated_at, conn)
-    if len(args) == 4:
-        status, created_at, updated_at, conn = args
-        return _create_ticket_db(
-            title, description, priority, status, created_at, updated_at, conn
-        )
 
-    raise TypeError("create_ticket_db called with unsupported signature")
+def create_ticket_db(title, description, priority, conn):
+    return _backend(conn).create_ticket(title, description, priority)
 
 
 def view_tickets_db(
     conn, filter_status=None, sort_by=None, search_keyword=None, page=1, per_page=10
 ):
-    cursor = conn.cursor()
-    query = "SELECT * FROM tickets"
-    filters = []
-    params = []
-
-    if filter_status:
-        filters.append("status = ?")
-        params.append(filter_status)
-
-    if search_keyword:
-        filters.append("(title LIKE ? OR description LIKE ?)")
-        params.extend([f"%{search_keyword}%", f"%{search_keyword}%"])
-
-    if filters:
-        query += " WHERE " + " AND ".join(filters)
-
-    if sort_by == "priority":
-        query += " ORDER BY CASE UPPER(priority) WHEN 'HIGH' THEN 1 WHEN 'MEDIUM' THEN 2 WHEN 'LOW' THEN 3 END"
-    elif sort_by == "date":
-        query += " ORDER BY created_at ASC"
-    else:
-        query += " ORDER BY id ASC"
-
-    offset = (page - 1) * per_page
-    query += " LIMIT ? OFFSET ?"
-    params.extend([per_page, offset])
-
-    cursor.execute(query, params)
-    return cursor.fetchall()
+    backend = _backend(conn)
+    tickets = backend.list_tickets(
+        filter_status=filter_status,
+        sort_by=SORT_ALIASES.get(sort_by, sort_by),
+        search=search_keyword,
+        offset=(page - 1) * per_page,
+        limit=per_page,
+    )
+    # List rows only carry a description preview; the legacy tuple has the
+    # full text
+    return [_row(backend.get_ticket(t.id)) for t in tickets]
 
 
 def get_ticket_count(conn, filter_status=None, search_keyword=None):
-    cursor = conn.cursor()
-    query = "SELECT COUNT(*) FROM tickets"
-    filters = []
-    params = []
-
-    if filter_status:
-        filters.append("status = ?")
-        params.append(filter_status)
-
-    if search_keyword:
-        filters.append("(title LIKE ? OR description LIKE ?)")
-        params.extend([f"%{search_keyword}%", f"%{search_keyword}%"])
-
-    if filters:
-        query += " WHERE " + " AND ".join(filters)
-
-    cursor.execute(query, params)
-    return cursor.fetchone()[0]
+    return _backend(conn).count_tickets(filter_status, search_keyword)
 
 
 def update_ticket_db(
     ticket_id, title=None, description=None, priority=None, status=None, conn=None
 ):
-    """Safe update that whitelists columns before building SQL to avoid dynamic injection."""
-    cursor = conn.cursor()
-    fields = []
-
-    if title is not None:
-        fields.append(("title", title))
-    if description is not None:
-        fields.append(("description", description))
-    if priority is not None:
-        fields.append(("priority", priority))
-    if status is not None:
-        fields.append(("status", status))
-
-    if not fields:
+    backend = _backend(conn)
+    ticket = backend.get_ticket(ticket_id)
+    if ticket is None:
         return 0
-
-    # Always update updated_at
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    fields.append(("updated_at", now))
-
-    # Validate and build SET clause with placeholders
-    # perform per-column updates using fixed SQL statements to avoid dynamic SQL
-    total_rows = 0
-    for col, val in fields:
-        if col not in VALID_UPDATE_COLUMNS:
-            raise ValueError(f"Invalid column for update: {col}")
-        # execute a fixed UPDATE per allowed column
-        if col == "title":
-            total_rows += cursor.execute(
-                "UPDATE tickets SET title = ?, updated_at = ? WHERE id = ?",
-                (val, now, ticket_id),
-            ).rowcount
-        elif col == "description":
-            total_rows += cursor.execute(
-                "UPDATE tickets SET description = ?, updated_at = ? WHERE id = ?",
-                (val, now, ticket_id),
-            ).rowcount
-        elif col == "priority":
-            total_rows += cursor.execute(
-                "UPDATE tickets SET priority = ?, updated_at = ? WHERE id = ?",
-                (val, now, ticket_id),
-            ).rowcount
-        elif col == "status":
-            total_rows += cursor.execute(
-                "UPDATE tickets SET status = ?, updated_at = ? WHERE id = ?",
-                (val, now, ticket_id),
-            ).rowcount
-
-    conn.commit()
-    return total_rows
+    return backend.update_ticket(
+        ticket_id,
+        ticket.title if title is None else title,
+        ticket.description if description is None else description,
+        ticket.priority if priority is None else priority,
+        ticket.status if status is None else status,
+    )
 
 
 def update_ticket_status_db(ticket_id, status, conn):
@@ -175,15 +86,11 @@ def update_ticket_status_db(ticket_id, status, conn):
 
 
 def delete_ticket_db(ticket_id, conn):
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM tickets WHERE id=?", (ticket_id,))
-    conn.commit()
-    return cursor.rowcount
+    return _backend(conn).delete_ticket(ticket_id)
 
 
 def create_ticket_logic(title, description, priority, conn):
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    return create_ticket_db(title, description, priority, "Open", now, now, conn)
+    return create_ticket_db(title, description, priority, conn)
 
 
 def main(conn=None):
@@ -196,13 +103,5 @@ def main(conn=None):
         title = input()
         desc = input()
         priority = input()
-        create_ticket_db(
-            title,
-            desc,
-            priority,
-            "Open",
-            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            conn,
-        )
+        create_ticket_db(title, desc, priority, conn)
     return
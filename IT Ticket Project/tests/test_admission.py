@@ -0,0 +1,229 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+from admission import ConcurrencyLimiter, RateLimiter, route_class
+from asgi import TicketASGI
+from ticketing_app import create_app
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_route_class():
+    assert route_class("GET") == route_class("head") == "read"
+    assert route_class("POST") == "write"
+
+
+def test_token_bucket_allows_burst_then_refills_per_client():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=2, burst=3, clock=clock)
+    assert [limiter.acquire("a") for _ in range(3)] == [0, 0, 0]
+    assert limiter.acquire("a") == pytest.approx(0.5)
+    assert limiter.acquire("b") == 0
+    clock.now = 0.5
+    assert limiter.acquire("a") == 0
+
+
+def test_token_bucket_forgets_least_recent_clients():
+    limiter = RateLimiter(rate=1, burst=1, max_clients=2, clock=FakeClock())
+    for client in ("a", "b", "c"):
+        limiter.acquire(client)
+    assert list(limiter._buckets) == ["b", "c"]
+
+
+def test_concurrency_limiter_queue_bound_and_timeout():
+    limiter = ConcurrencyLimiter(limit=1, queue_size=1, timeout=0.05)
+    assert limiter.acquire()
+    assert not limiter.acquire()  # queued, then timed out
+
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(limiter.acquire()))
+    limiter.timeout = 5
+    waiter.start()
+    deadline = time.monotonic() + 5
+    while limiter.waiting == 0 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert limiter.waiting == 1
+    assert not limiter.acquire()  # queue full: rejected immediately
+    limiter.release()
+    waiter.join()
+    assert results == [True] and limiter.active == 1
+
+
+def test_async_waiters_share_the_queue_bound():
+    async def scenario():
+        limiter = ConcurrencyLimiter(limit=1, queue_size=1, timeout=5)
+        assert await limiter.acquire_async()
+        waiter = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0)
+        assert limiter.waiting == 1
+        assert not await limiter.acquire_async()  # queue full
+        assert not limiter.acquire()  # threads count against the same bound
+        limiter.release()
+        assert await waiter
+        assert (limiter.active, limiter.waiting) == (1, 0)
+
+        limiter.timeout = 0.01
+        assert not await limiter.acquire_async()
+        assert (limiter.active, limiter.waiting) == (1, 0)
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_async_waiter_does_not_leak_a_slot():
+    async def scenario():
+        limiter = ConcurrencyLimiter(limit=1, queue_size=4, timeout=5)
+        assert await limiter.acquire_async()
+        waiter = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert limiter.waiting == 0
+        limiter.release()
+        assert limiter.active == 0
+
+        # Cancelled after the slot was handed over but before it resumed
+        assert await limiter.acquire_async()
+        waiter = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0)
+        limiter.release()
+        waiter.cancel()
+        try:
+            granted = await waiter  # wait_for may still deliver the slot
+        except asyncio.CancelledError:
+            granted = False
+        if granted:
+            limiter.release()
+        await asyncio.sleep(0)
+        assert (limiter.active, limiter.waiting) == (0, 0)
+
+    asyncio.run(scenario())
+
+
+def _app(tmp_path, **config):
+    return create_app(
+        {
+            "TESTING": True,
+            "DATABASE_PATH": str(tmp_path / "tickets.db"),
+            "ADMISSION_ENABLED": True,
+            **config,
+        }
+    )
+
+
+def test_rate_limited_client_gets_429_with_retry_after(tmp_path):
+    client = _app(tmp_path, RATE_LIMIT_PER_SECOND=0.1, RATE_LIMIT_BURST=2).test_client()
+    assert client.get("/").status_code == 200
+    assert client.get("/").status_code == 200
+    resp = client.get("/")
+    assert resp.status_code == 429
+    assert resp.headers["Retry-After"] == "10"
+    other = client.get("/", environ_base={"REMOTE_ADDR": "10.0.0.2"})
+    assert other.status_code == 200
+
+
+def test_full_write_class_sheds_writes_but_not_reads(tmp_path):
+    app = _app(tmp_path, ADMISSION_QUEUE_TIMEOUT=0)
+    client = app.test_client()
+    write = app.extensions["admission"].limiters["write"]
+    for _ in range(write.limit):
+        assert write.try_acquire()
+
+    resp = client.post(
+        "/create",
+        data={
+            "title": "Storm",
+            "description": "Alert storm ticket",
+            "priority": "High",
+        },
+    )
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "1"
+    assert client.get("/").status_code == 200
+
+    write.release()
+    resp = client.post(
+        "/create",
+        data={
+            "title": "Storm",
+            "description": "Alert storm ticket",
+            "priority": "High",
+        },
+    )
+    assert resp.status_code == 302
+
+
+def test_asgi_native_routes_are_admitted(tmp_path):
+    app = TicketASGI(_app(tmp_path, RATE_LIMIT_PER_SECOND=1, RATE_LIMIT_BURST=1))
+
+    async def get():
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/tickets",
+            "query_string": b"",
+            "headers": [],
+            "client": ("127.0.0.1", 5000),
+        }
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            sent.append(message)
+
+        await app(scope, receive, send)
+        return sent[0]["status"], dict(sent[0]["headers"]), sent[1]["body"]
+
+    assert asyncio.run(get())[0] == 200
+    status, headers, body = asyncio.run(get())
+    assert status == 429
+    assert headers[b"retry-after"] == b"1"
+    assert json.loads(body)["errors"]
+
+
+def test_asgi_gates_bridged_requests_once(tmp_path):
+    flask_app = _app(tmp_path, ADMISSION_WRITE_LIMIT=1, ADMISSION_QUEUE_TIMEOUT=0)
+    app = TicketASGI(flask_app)
+    write = flask_app.extensions["admission"].limiters["write"]
+
+    async def create():
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/create",
+            "query_string": b"",
+            "headers": [(b"content-type", b"application/x-www-form-urlencoded")],
+            "client": ("127.0.0.1", 5000),
+        }
+        body = b"title=Storm&description=Alert+storm+ticket&priority=High"
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message):
+            sent.append(message)
+
+        await app(scope, receive, send)
+        return sent[0]["status"], dict(sent[0]["headers"])
+
+    # Admitted once by the adapter; the WSGI middleware must not gate it again
+    assert asyncio.run(create())[0] == 302
+    assert write.active == 0
+
+    assert write.try_acquire()
+    status, headers = asyncio.run(create())
+    assert status == 503
+    assert headers[b"content-type"].startswith(b"text/plain")
+    write.release()
@@ -0,0 +1,70 @@
+"""End-to-end route tests against every storage backend."""
+
+
+def test_create_list_update_delete(client, create_ticket):
+    assert create_ticket(client).status_code == 302
+    page = client.get("/")
+    assert b"Server down" in page.data
+
+    resp = client.post(
+        "/update/1",
+        data={
+            "title": "Server up",
+            "description": "Main server is back",
+            "priority": "Low",
+            "status": "Closed",
+        },
+    )
+    assert resp.status_code == 302
+    assert b"Server up" in client.get("/?filter_status=Closed").data
+
+    assert client.post("/delete/1").status_code == 302
+    assert b"No tickets found" in client.get("/").data
+
+
+def test_create_rejects_invalid_ticket(client):
+    resp = client.post(
+        "/create", data={"title": "", "description": "short", "priority": "Urgent"}
+    )
+    assert resp.status_code == 200
+    assert b"Invalid priority selected." in resp.data
+    assert b"No tickets found" in client.get("/").data
+
+
+def test_claim_next_ticket_route(client, create_ticket):
+    create_ticket(client, title="Low one", priority="Low")
+    create_ticket(client, title="High one", priority="High")
+
+    resp = client.post("/claim", data={"assignee": "alice"})
+    assert resp.status_code == 302
+    assert resp.headers["Location"].endswith("/update/2")
+    assert b"alice" in client.get("/").data
+
+    client.post("/claim", data={"assignee": "bob"})
+    resp = client.post("/claim", data={"assignee": "carol"}, follow_redirects=True)
+    assert b"No open tickets to claim." in resp.data
+
+    resp = client.post("/release/2", data={"assignee": "bob"}, follow_redirects=True)
+    assert b"Ticket is not claimed by you." in resp.data
+    resp = client.post("/release/2", data={"assignee": "alice"}, follow_redirects=True)
+    assert b"Ticket returned to the queue." in resp.data
+
+
+def test_claim_requires_assignee(client):
+    resp = client.post("/claim", data={"assignee": ""}, follow_redirects=True)
+    assert b"Assignee must be between 1 and 100 characters." in resp.data
+
+
+def test_suggest_endpoint(client, create_ticket):
+    create_ticket(client, title="Printer jam")
+    create_ticket(client, title="Printer offline")
+    create_ticket(client, title="VPN down")
+    data = client.get("/suggest?q=print").get_json()
+    assert [s["title"] for s in data["suggestions"]] == [
+        "Printer offline",
+        "Printer jam",
+    ]
+    assert client.get("/suggest?q=print&limit=1").get_json()["suggestions"] == [
+        {"id": 2, "title": "Printer offline"}
+    ]
+    assert client.get("/suggest?q=").get_json() == {"suggestions": []}
@@ -0,0 +1,171 @@
+"""ASGI adapter tests, driven directly through the ASGI callable."""
+
+import asyncio
+import json
+
+import pytest
+from asgi import TicketASGI
+
+
+@pytest.fixture
+def app_config():
+    return {"DB_EXECUTOR_WORKERS": 2}
+
+
+@pytest.fixture
+def asgi_app(app):
+    app = TicketASGI(app)
+    yield app
+    asyncio.run(_lifespan_shutdown(app))
+
+
+async def _lifespan_shutdown(app):
+    messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message["type"])
+
+    await app({"type": "lifespan"}, receive, send)
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+
+
+async def _request(app, method, path, query=b"", body=b"", headers=()):
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query,
+        "headers": list(headers),
+        "http_version": "1.1",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "client": ("127.0.0.1", 5000),
+    }
+    received = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return received.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent[0]["status"], dict(sent[0]["headers"]), sent[1]["body"]
+
+
+def test_api_create_get_and_list(asgi_app):
+    async def scenario():
+        status, _, body = await _request(
+            asgi_app,
+            "POST",
+            "/api/tickets",
+            body=json.dumps(
+                {
+                    "title": "VPN down",
+                    "description": "VPN is down again",
+                    "priority": "High",
+                }
+            ).encode(),
+        )
+        assert status == 201
+        tid = json.loads(body)["id"]
+
+        status, _, body = await _request(asgi_app, "GET", f"/api/tickets/{tid}")
+        assert status == 200
+        assert json.loads(body)["title"] == "VPN down"
+
+        status, _, _ = await _request(asgi_app, "GET", "/api/tickets/999")
+        assert status == 404
+
+        status, _, body = await _request(
+            asgi_app, "GET", "/api/tickets", query=b"filter_status=Open&search=vpn"
+        )
+        payload = json.loads(body)
+        assert status == 200
+        assert payload["total"] == 1
+        assert payload["tickets"][0]["id"] == tid
+
+    asyncio.run(scenario())
+
+
+def test_api_create_validation_error(asgi_app):
+    status, _, body = asyncio.run(
+        _request(asgi_app, "POST", "/api/tickets", body=b'{"title": ""}')
+    )
+    assert status == 400
+    assert "Invalid priority selected." in json.loads(body)["errors"]
+
+
+def test_html_routes_are_bridged_to_wsgi(asgi_app):
+    async def scenario():
+        form = b"title=Printer&description=Printer+is+jammed&priority=Low"
+        status, headers, _ = await _request(
+            asgi_app,
+            "POST",
+            "/create",
+            body=form,
+            headers=[(b"content-type", b"application/x-www-form-urlencoded")],
+        )
+        assert status == 302
+        assert headers[b"Location"] == b"/"
+
+        status, _, body = await _request(asgi_app, "GET", "/", query=b"search=printer")
+        assert status == 200
+        assert b"Printer" in body
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_requests_share_bounded_executor(asgi_app):
+    async def scenario():
+        await asyncio.gather(
+            *[
+                _request(
+                    asgi_app,
+                    "POST",
+                    "/api/tickets",
+                    body=json.dumps(
+                        {
+                            "title": f"T{i}",
+                            "description": "Concurrent create",
+                            "priority": "Low",
+                        }
+                    ).encode(),
+                )
+                for i in range(20)
+            ]
+        )
+        _, _, body = await _request(
+            asgi_app, "GET", "/api/tickets", query=b"per_page=100"
+        )
+        return json.loads(body)["total"]
+
+    assert asyncio.run(scenario()) == 20
+
+
+@pytest.mark.parametrize("body", [b"[]", b'"x"', b"3", b"not json"])
+def test_api_rejects_non_object_bodies(asgi_app, body):
+    async def scenario():
+        for path in ("/api/tickets", "/api/tickets/claim"):
+            status, _, content = await _request(asgi_app, "POST", path, body=body)
+            assert status == 400
+            assert json.loads(content) == {
+                "errors": ["Request body must be a JSON object."]
+            }
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("lease", [0, -60, 10**12, "60", 1.5, True])
+def test_api_claim_rejects_bad_lease(asgi_app, lease):
+    payload = json.dumps({"assignee": "alice", "lease_seconds": lease}).encode()
+    status, _, content = asyncio.run(
+        _request(asgi_app, "POST", "/api/tickets/claim", body=payload)
+    )
+    assert status == 400
+    assert json.loads(content)["errors"][0].startswith("Lease must be")
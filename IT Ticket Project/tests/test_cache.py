@@ -0,0 +1,56 @@
+"""Cross-process cache coherence through the ticket generation counter."""
+
+import sqlite3
+
+from cache import GenerationCache, current_generation
+from services.ticket_service import count_tickets_service, create_ticket_service
+from ticketing_app import create_app
+
+
+def _worker(db_path):
+    """One app per simulated worker process: separate caches, shared file."""
+    return create_app({"TESTING": True, "DATABASE_PATH": db_path})
+
+
+def test_count_cache_sees_other_workers_writes(tmp_path):
+    db_path = str(tmp_path / "tickets.db")
+    worker_a, worker_b = _worker(db_path), _worker(db_path)
+
+    with worker_a.app_context():
+        assert count_tickets_service() == 0
+    with worker_a.app_context():
+        assert count_tickets_service() == 0
+    assert worker_a.extensions["generation_caches"]["ticket_counts"].hits == 1
+
+    with worker_b.app_context():
+        assert create_ticket_service("VPN down", "VPN is down again", "High")[0]
+    with worker_a.app_context():
+        assert count_tickets_service() == 1
+
+    # Writes that bypass the service layer invalidate too (triggers)
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute("DELETE FROM tickets")
+    conn.close()
+    with worker_a.app_context():
+        assert count_tickets_service() == 0
+
+
+def test_write_in_same_request_rereads_generation(tmp_path):
+    app = _worker(str(tmp_path / "tickets.db"))
+    with app.app_context():
+        assert count_tickets_service() == 0
+        before = current_generation()
+        create_ticket_service("VPN down", "VPN is down again", "High")
+        assert current_generation() != before
+        assert count_tickets_service() == 1
+
+
+def test_generation_cache_is_bounded_lru(tmp_path):
+    app = _worker(str(tmp_path / "tickets.db"))
+    cache = GenerationCache(maxsize=2)
+    with app.app_context():
+        for key in ("a", "b", "a", "c"):
+            cache.get(key, lambda key=key: key.upper())
+        assert list(cache._data) == ["a", "c"]
+        assert (cache.hits, cache.misses) == (1, 3)
@@ -0,0 +1,94 @@
+"""Row fragment cache, bytecode cache and ETag / gzip response tests."""
+
+import gzip
+
+from ticketing_app import create_app
+
+
+def _update(client, ticket_id, title, status="Open"):
+    client.post(
+        f"/update/{ticket_id}",
+        data={
+            "title": title,
+            "description": "Main server is down",
+            "priority": "High",
+            "status": status,
+        },
+    )
+
+
+def test_rows_are_rendered_once_per_version(app, client, create_ticket):
+    cache = app.extensions["fragment_cache"]
+    create_ticket(client, "Server down")
+    create_ticket(client, "VPN slow")
+
+    client.get("/")
+    assert (cache.hits, cache.misses) == (0, 2)
+    client.get("/")
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    # Same-second update: updated_at is unchanged but the fields differ
+    _update(client, 1, "Server back up", status="Closed")
+    page = client.get("/").data
+    assert b"Server back up" in page and b"Server down" not in page
+    assert (cache.hits, cache.misses) == (3, 3)
+
+
+def test_bytecode_cache_is_off_by_default(app):
+    assert app.jinja_env.bytecode_cache is None
+
+
+def test_bytecode_cache_is_written(tmp_path):
+    (tmp_path / "jinja").mkdir()
+    app = create_app(
+        {
+            "TESTING": True,
+            "DATABASE_PATH": str(tmp_path / "tickets.db"),
+            "JINJA_BYTECODE_CACHE": True,
+            "JINJA_BYTECODE_CACHE_DIR": str(tmp_path / "jinja"),
+        }
+    )
+    app.test_client().get("/")
+    assert list((tmp_path / "jinja").iterdir())
+
+
+def test_strong_etag_and_conditional_get(app, client, create_ticket):
+    app.config["RESPONSE_ETAGS"] = True
+    from http_cache import init_http_cache
+
+    init_http_cache(app)
+    create_ticket(client, "Server down")
+    client.get("/")  # consume the flash message so the page is stable
+
+    first = client.get("/")
+    etag = first.headers["ETag"]
+    assert not etag.startswith("W/")
+    assert client.get("/", headers={"If-None-Match": etag}).status_code == 304
+
+    _update(client, 1, "Server back up")
+    assert client.get("/", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_gzip_compression_with_separate_etag(tmp_path):
+    app = create_app(
+        {
+            "TESTING": True,
+            "DATABASE_PATH": str(tmp_path / "tickets.db"),
+            "RESPONSE_ETAGS": True,
+            "RESPONSE_COMPRESSION": True,
+        }
+    )
+    client = app.test_client()
+    plain = client.get("/")
+    zipped = client.get("/", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in plain.headers
+    assert zipped.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in zipped.headers["Vary"]
+    assert gzip.decompress(zipped.data) == plain.data
+    assert zipped.headers["ETag"] != plain.headers["ETag"]
+    revalidated = client.get(
+        "/",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": zipped.headers["ETag"]},
+    )
+    assert revalidated.status_code == 304
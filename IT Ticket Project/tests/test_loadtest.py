@@ -0,0 +1,68 @@
+import json
+
+import pytest
+from benchmarks.loadtest import main, parse_mix, percentile
+
+
+def test_parse_mix():
+    assert parse_mix("home=3,create=1") == {"home": 3, "create": 1}
+    with pytest.raises(ValueError):
+        parse_mix("home=1,explode=2")
+    with pytest.raises(ValueError):
+        parse_mix("home=0")
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([7.0], 99) == 7.0
+    assert percentile([], 50) == 0.0
+
+
+def test_short_run_writes_json_report(tmp_path):
+    out = tmp_path / "report.json"
+    main(
+        [
+            # No deletes, so every update targets an existing ticket
+            "--mix",
+            "home=70,create=10,update=15",
+            "--duration",
+            "0.5",
+            "--clients",
+            "2",
+            "--rows",
+            "50",
+            "--output",
+            str(out),
+        ]
+    )
+    report = json.loads(out.read_text())
+    assert set(report["routes"]) == {"home", "create", "update"}
+    assert report["total"]["requests"] > 0
+    assert report["total"]["errors"] == 0
+    for stats in report["routes"].values():
+        assert set(stats["latency_ms"]) == {"mean", "p50", "p95", "p99", "max"}
+
+
+def test_flash_reported_failures_are_counted(tmp_path):
+    # An empty database: every update targets a missing ticket and gets a 302
+    # with a "Ticket not found." danger flash
+    report = main(
+        [
+            "--mix",
+            "update=1",
+            "--duration",
+            "0.3",
+            "--clients",
+            "1",
+            "--rows",
+            "0",
+            "--output",
+            str(tmp_path / "report.json"),
+        ]
+    )
+    stats = report["routes"]["update"]
+    assert stats["requests"] > 0
+    assert stats["errors"] == stats["requests"]
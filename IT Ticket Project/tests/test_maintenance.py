@@ -0,0 +1,202 @@
+import sqlite3
+import subprocess
+import sys
+
+import maintenance
+import pytest
+from database import setup_db
+
+
+def _seed(path, rows=400):
+    conn = sqlite3.connect(path)
+    setup_db(conn)
+    conn.executemany(
+        "INSERT INTO tickets (title, description, priority) VALUES (?, ?, ?)",
+        [(f"Ticket {i}", "x" * 500, "Low") for i in range(rows)],
+    )
+    conn.commit()
+    return conn
+
+
+def test_new_databases_use_incremental_auto_vacuum(tmp_path):
+    conn = _seed(tmp_path / "t.db", rows=1)
+    assert (
+        maintenance.status(conn)["auto_vacuum"] == maintenance.AUTO_VACUUM_INCREMENTAL
+    )
+
+
+def test_incremental_vacuum_reclaims_in_bounded_slices(tmp_path):
+    conn = _seed(tmp_path / "t.db")
+    conn.execute("DELETE FROM tickets")
+    conn.commit()
+    free = maintenance.status(conn)["freelist_count"]
+    assert free > 20
+
+    assert maintenance.incremental_vacuum(conn, max_pages=10, pages=4, sleep=0) == 10
+    assert maintenance.status(conn)["freelist_count"] == free - 10
+    maintenance.incremental_vacuum(conn, pages=4, sleep=0)
+    assert maintenance.status(conn)["freelist_count"] == 0
+
+
+def test_enable_incremental_vacuum_on_legacy_database(tmp_path):
+    conn = sqlite3.connect(tmp_path / "legacy.db")
+    conn.execute("CREATE TABLE t (x)")
+    conn.commit()
+    assert maintenance.incremental_vacuum(conn, sleep=0) == 0
+    assert maintenance.enable_incremental_vacuum(conn)
+    assert not maintenance.enable_incremental_vacuum(conn)
+
+
+WRITER = """
+import sqlite3, sys, time
+conn = sqlite3.connect(sys.argv[1], timeout=30)
+conn.execute("INSERT INTO tickets (title, description, priority) VALUES ('w', 'w', 'High')")
+conn.commit()
+print("ready", flush=True)
+while True:
+    conn.execute("UPDATE tickets SET title = title || 'x' WHERE id = 1")
+    conn.commit()
+    time.sleep(0.005)
+"""
+
+
+def test_backup_completes_under_concurrent_writes(tmp_path):
+    db_path = str(tmp_path / "t.db")
+    conn = _seed(db_path)
+    # Another process: same-process writers are folded into the copy by
+    # SQLite and never force a restart.
+    writer = subprocess.Popen(
+        [sys.executable, "-c", WRITER, db_path], stdout=subprocess.PIPE, text=True
+    )
+    try:
+        assert writer.stdout.readline().strip() == "ready"
+        dest = tmp_path / "backups" / "snap.db"
+        copied = maintenance.backup(
+            conn, str(dest), pages=4, sleep=0.01, max_restarts=2
+        )
+    finally:
+        writer.kill()
+        writer.wait()
+
+    # Whether the stepped copy finished or fell back depends on timing; either
+    # way the snapshot must be whole
+    assert copied > 0
+    snap = sqlite3.connect(dest)
+    assert snap.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+    assert snap.execute("SELECT COUNT(*) FROM tickets").fetchone()[0] == 401
+    assert not (tmp_path / "backups" / "snap.db.part").exists()
+
+
+class WriteAfterSecondStep:
+    """Connection proxy whose stepped backup sees one write from another process.
+
+    The write lands between steps 2 and 3, so SQLite restarts the copy and the
+    next step reports more pages remaining than the last one.
+    """
+
+    def __init__(self, conn, db_path):
+        self.conn = conn
+        self.db_path = db_path
+        self.steps = []
+
+    def __getattr__(self, name):
+        return getattr(self.conn, name)
+
+    def backup(self, target, pages=-1, progress=None):
+        def step(status, remaining, total):
+            self.steps.append((pages, remaining))
+            if len(self.steps) == 2:
+                subprocess.run(
+                    [sys.executable, "-c", ONE_WRITE, self.db_path], check=True
+                )
+            progress(status, remaining, total)
+
+        if progress is None:
+            self.steps.append((pages, None))
+            return self.conn.backup(target, pages=pages)
+        return self.conn.backup(target, pages=pages, progress=step)
+
+
+ONE_WRITE = """
+import sqlite3, sys
+conn = sqlite3.connect(sys.argv[1], timeout=30)
+conn.execute("UPDATE tickets SET title = 'changed' WHERE id = 1")
+conn.commit()
+"""
+
+
+def test_restarted_backup_falls_back_to_a_single_step(tmp_path, caplog):
+    db_path = str(tmp_path / "t.db")
+    conn = WriteAfterSecondStep(_seed(db_path), db_path)
+    dest = tmp_path / "snap.db"
+
+    maintenance.backup(conn, str(dest), pages=4, sleep=0, max_restarts=0)
+
+    remaining = [r for _, r in conn.steps]
+    assert remaining[2] > remaining[1]  # the copy restarted
+    assert conn.steps[-1] == (-1, None)  # then was redone in one step
+    assert "copying in a single step" in caplog.text
+    snap = sqlite3.connect(dest)
+    assert snap.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+    assert snap.execute("SELECT title FROM tickets WHERE id = 1").fetchone() == (
+        "changed",
+    )
+    assert not (tmp_path / "snap.db.part").exists()
+
+
+def test_failed_backup_leaves_no_part_file_and_worker_survives(tmp_path):
+    db_path = str(tmp_path / "tickets.db")
+    _seed(db_path, rows=5).close()
+    (tmp_path / "backups").write_text("not a directory")
+    worker = maintenance.MaintenanceWorker(
+        db_path,
+        {
+            "MAINTENANCE_BACKUP_INTERVAL": 1,
+            "MAINTENANCE_BACKUP_DIR": str(tmp_path / "backups" / "nested"),
+            "MAINTENANCE_STEP_SLEEP": 0,
+        },
+        clock=lambda: 0.0,
+    )
+    assert worker.run_due() == ["optimize", "vacuum", "backup"]
+    assert worker._last_run["backup"] == 0.0
+
+    conn = sqlite3.connect(db_path)
+    dest = tmp_path / "snap.db"
+    dest.mkdir()  # os.replace onto a directory fails after the copy
+    with pytest.raises(OSError):
+        maintenance.backup(conn, str(dest), sleep=0)
+    assert not (tmp_path / "snap.db.part").exists()
+
+
+def test_worker_runs_due_jobs_and_prunes_backups(tmp_path):
+    db_path = str(tmp_path / "tickets.db")
+    _seed(db_path).close()
+    now = [0.0]
+    worker = maintenance.MaintenanceWorker(
+        db_path,
+        {
+            "MAINTENANCE_OPTIMIZE_INTERVAL": 100,
+            "MAINTENANCE_VACUUM_INTERVAL": 10,
+            "MAINTENANCE_BACKUP_INTERVAL": 50,
+            "MAINTENANCE_BACKUP_DIR": str(tmp_path / "backups"),
+            "MAINTENANCE_BACKUP_KEEP": 1,
+            "MAINTENANCE_STEP_SLEEP": 0,
+        },
+        clock=lambda: now[0],
+    )
+    assert worker.run_due() == ["optimize", "vacuum", "backup"]
+    assert worker.run_due() == []
+    now[0] = 10
+    assert worker.run_due() == ["vacuum"]
+    (tmp_path / "backups" / "tickets-00000000-000000.db").write_bytes(b"")
+    now[0] = 60
+    assert worker.run_due() == ["vacuum", "backup"]
+    assert len(list((tmp_path / "backups").iterdir())) == 1
+
+
+@pytest.mark.parametrize("command", [["status"], ["optimize", "--analyze"], ["vacuum"]])
+def test_cli(tmp_path, capsys, command):
+    db_path = str(tmp_path / "t.db")
+    _seed(db_path, rows=5).close()
+    maintenance.main(["--db", db_path, *command])
+    assert capsys.readouterr().out
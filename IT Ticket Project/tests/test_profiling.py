@@ -0,0 +1,59 @@
+import os
+
+import pytest
+from ticketing_app import create_app
+
+
+def _make_client(tmp_path, **overrides):
+    config = {
+        "TESTING": True,
+        "DATABASE_PATH": str(tmp_path / "tickets.db"),
+        "PROFILING_ENABLED": True,
+        "PROFILING_TOKEN": "let-me-profile",
+        "PROFILING_DIR": str(tmp_path / "profiles"),
+    }
+    config.update(overrides)
+    return create_app(config).test_client()
+
+
+def _profiles(tmp_path, ext):
+    out = tmp_path / "profiles"
+    return sorted(f for f in os.listdir(out) if f.endswith(ext)) if out.exists() else []
+
+
+def test_token_header_profiles_request(tmp_path):
+    client = _make_client(tmp_path)
+    resp = client.get(
+        "/?sort_by=priority", headers={"X-Profile-Token": "let-me-profile"}
+    )
+    assert resp.status_code == 200
+
+    (summary,) = _profiles(tmp_path, ".txt")
+    assert summary.endswith("tickets.home.txt")
+    text = (tmp_path / "profiles" / summary).read_text()
+    assert "GET /?sort_by=priority" in text
+    for category in ("route", "service", "sql", "template"):
+        assert f"  {category} " in text
+    assert len(_profiles(tmp_path, ".collapsed")) == 1
+    assert len(_profiles(tmp_path, ".prof")) == 1
+
+
+@pytest.mark.parametrize("headers", [{}, {"X-Profile-Token": "wrong"}])
+def test_requests_without_valid_token_are_not_profiled(tmp_path, headers):
+    client = _make_client(tmp_path)
+    assert client.get("/", headers=headers).status_code == 200
+    assert _profiles(tmp_path, ".txt") == []
+
+
+def test_disabled_by_default(tmp_path):
+    client = _make_client(tmp_path, PROFILING_ENABLED=False)
+    client.get("/", headers={"X-Profile-Token": "let-me-profile"})
+    assert _profiles(tmp_path, ".txt") == []
+
+
+def test_sampling_and_rotation(tmp_path):
+    client = _make_client(tmp_path, PROFILING_SAMPLE_RATE=2, PROFILING_KEEP=2)
+    for _ in range(8):
+        client.get("/")
+    assert len(_profiles(tmp_path, ".txt")) == 2
+    assert len(_profiles(tmp_path, ".collapsed")) == 2
@@ -110,3 +110,9 @@ def test_create_ticket_via_menu(monkeypatch, conn):
     assert len(tickets) == 1
     assert tickets[0][1] == "Test Ticket"
     assert tickets[0][3] == "High"
+
+
+def test_view_returns_full_description(conn):
+    description = "x" * 500
+    create_ticket_db("Long", description, "Low", conn)
+    assert view_tickets_db(conn)[0][2] == description
@@ -0,0 +1,141 @@
+import sqlite3
+import time
+
+import pytest
+from sla import SLAScheduler, parse_timestamp
+from storage.memory_backend import MemoryBackend, _now
+from storage.sqlite_backend import SQLiteBackend
+
+SLA = {"High": 60, "Medium": 600, "Low": 3600}
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _scheduler(app, clock, fired):
+    scheduler = SLAScheduler(app, SLA, on_escalate=fired.append, clock=clock)
+    app.extensions.setdefault("ticket_write_hooks", []).append(scheduler.on_write)
+    return scheduler
+
+
+def test_fires_exactly_when_due_in_deadline_order(app, client, create_ticket):
+    clock = FakeClock(parse_timestamp(_now()))
+    fired = []
+    scheduler = _scheduler(app, clock, fired)
+    scheduler.load()
+    create_ticket(client, "low", "Low")
+    create_ticket(client, "high", "High")
+    create_ticket(client, "medium", "Medium")
+
+    base = clock.now
+    assert scheduler.next_deadline() == pytest.approx(base + 60, abs=2)
+
+    clock.now = base + 30
+    assert scheduler.run_pending() == []
+    clock.now = base + 61
+    assert scheduler.run_pending() == [2]
+    clock.now = base + 4000
+    assert scheduler.run_pending() == [3, 1]
+    assert [t.title for t in fired] == ["high", "medium", "low"]
+    assert scheduler.next_deadline() is None
+    assert b"SLA breached" in client.get("/").data
+
+
+def test_write_hooks_reschedule_and_drop(app, client, create_ticket):
+    clock = FakeClock(parse_timestamp(_now()))
+    fired = []
+    scheduler = _scheduler(app, clock, fired)
+    scheduler.load()
+    create_ticket(client, "closed soon", "High")
+    create_ticket(client, "deleted", "High")
+    create_ticket(client, "downgraded", "High")
+
+    client.post(
+        "/update/1",
+        data={
+            "title": "closed soon",
+            "description": "Resolved already",
+            "priority": "High",
+            "status": "Closed",
+        },
+    )
+    client.post("/delete/2")
+    client.post(
+        "/update/3",
+        data={
+            "title": "downgraded",
+            "description": "Not urgent after all",
+            "priority": "Low",
+            "status": "In Progress",
+        },
+    )
+    clock.now += 120
+    assert scheduler.run_pending() == []
+    clock.now += 3600
+    assert scheduler.run_pending() == [3]
+
+
+def test_restart_recovers_pending_and_skips_escalated(app, client, create_ticket):
+    create_ticket(client, "a", "High")
+    create_ticket(client, "b", "High")
+    clock = FakeClock(parse_timestamp(_now()) + 61)
+
+    first = SLAScheduler(app, SLA, on_escalate=lambda t: None, clock=clock)
+    first.load()
+    assert first.run_pending() == [1, 2]
+
+    create_ticket(client, "c", "High")
+    restarted = SLAScheduler(app, SLA, on_escalate=lambda t: None, clock=clock)
+    restarted.load()
+    clock.now += 61
+    assert restarted.run_pending() == [3]
+
+
+def test_failed_escalation_is_retried_not_lost(app, client, create_ticket, monkeypatch):
+    create_ticket(client, "a", "High")
+    create_ticket(client, "b", "High")
+    clock = FakeClock(parse_timestamp(_now()) + 61)
+    scheduler = SLAScheduler(
+        app, SLA, on_escalate=lambda t: None, clock=clock, retry_delay=10
+    )
+    scheduler.load()
+
+    original = {cls: cls.escalate_ticket for cls in (SQLiteBackend, MemoryBackend)}
+    failures = []
+
+    def locked_once(self, ticket_id, statuses):
+        if ticket_id == 1 and not failures:
+            failures.append(ticket_id)
+            raise sqlite3.OperationalError("database is locked")
+        return original[type(self)](self, ticket_id, statuses)
+
+    for cls in original:
+        monkeypatch.setattr(cls, "escalate_ticket", locked_once)
+
+    assert scheduler.run_pending() == [2]
+    assert scheduler.next_deadline() == pytest.approx(clock.now + 10)
+    assert scheduler.run_pending() == []
+    clock.now += 10
+    assert scheduler.run_pending() == [1]
+    assert scheduler.next_deadline() is None
+
+
+def test_background_thread_escalates(app, client, create_ticket):
+    app.config["SLA_SECONDS"] = {"High": 0, "Medium": 600, "Low": 3600}
+    fired = []
+    scheduler = SLAScheduler(app, app.config["SLA_SECONDS"], on_escalate=fired.append)
+    scheduler.start()
+    try:
+        app.extensions.setdefault("ticket_write_hooks", []).append(scheduler.on_write)
+        create_ticket(client, "urgent", "High")
+        deadline = time.monotonic() + 5
+        while not fired and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        scheduler.stop()
+    assert [t.title for t in fired] == ["urgent"]
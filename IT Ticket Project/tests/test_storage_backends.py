@@ -0,0 +1,379 @@
+"""Conformance suite run against every storage backend."""
+
+import sqlite3
+
+import pytest
+from database import DESCRIPTION_PREVIEW_LENGTH, PRIORITY_RANKS, setup_db
+from storage.memory_backend import MemoryBackend
+from storage.sqlite_backend import SQLiteBackend
+
+
+def _sqlite_backend():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    setup_db(conn)
+    return SQLiteBackend(conn)
+
+
+BACKEND_FACTORIES = {"sqlite": _sqlite_backend, "memory": MemoryBackend}
+
+
+@pytest.fixture(params=sorted(BACKEND_FACTORIES))
+def backend(request):
+    b = BACKEND_FACTORIES[request.param]()
+    yield b
+    b.close()
+
+
+@pytest.fixture
+def seeded(backend):
+    backend.create_ticket("Printer jam", "Printer on floor 2 jams", "Low")
+    backend.create_ticket("Server down", "Main server is down", "High")
+    backend.create_ticket("VPN slow", "VPN is slow from home", "Medium")
+    backend.create_ticket("Email bounce", "Mail server rejects mail", "High")
+    backend.create_ticket("New laptop", "Laptop request for hire", "Low")
+    return backend
+
+
+def test_create_and_get(backend):
+    tid = backend.create_ticket("Server Down", "Main server is down", "High")
+    t = backend.get_ticket(tid)
+    assert t.id == tid
+    assert t.title == "Server Down"
+    assert t.priority == "High"
+    assert t.status == "Open"
+    assert t.created_at == t.updated_at
+
+
+def test_get_missing_returns_none(backend):
+    assert backend.get_ticket(9999) is None
+
+
+def test_update_ticket(backend):
+    tid = backend.create_ticket("Ticket1", "Open ticket", "Low")
+    assert (
+        backend.update_ticket(tid, "Ticket1b", "Edited ticket", "High", "Closed") == 1
+    )
+    t = backend.get_ticket(tid)
+    assert (t.title, t.priority, t.status) == ("Ticket1b", "High", "Closed")
+    assert backend.update_ticket(9999, "x", "y", "Low", "Open") == 0
+
+
+def test_delete_ticket(backend):
+    tid = backend.create_ticket("Delete Me", "Test delete", "Medium")
+    assert backend.delete_ticket(tid) == 1
+    assert backend.delete_ticket(tid) == 0
+    assert backend.get_ticket(tid) is None
+    assert backend.count_tickets() == 0
+
+
+def test_list_default_order_and_pagination(seeded):
+    ids = [t.id for t in seeded.list_tickets(limit=100)]
+    assert ids == sorted(ids)
+    page2 = [t.id for t in seeded.list_tickets(offset=2, limit=2)]
+    assert page2 == ids[2:4]
+
+
+def test_filter_and_count(seeded):
+    tid = seeded.list_tickets(limit=1)[0].id
+    seeded.update_ticket(tid, "Printer jam", "Printer on floor 2 jams", "Low", "Closed")
+    closed = seeded.list_tickets(filter_status="Closed")
+    assert [t.id for t in closed] == [tid]
+    assert seeded.count_tickets(filter_status="Closed") == 1
+    assert seeded.count_tickets(filter_status="Open") == 4
+    assert seeded.count_tickets() == 5
+
+
+def test_search_is_case_insensitive(seeded):
+    titles = {t.title for t in seeded.list_tickets(search="SERVER")}
+    assert titles == {"Server down", "Email bounce"}
+    assert seeded.count_tickets(search="server") == 2
+    assert seeded.count_tickets(filter_status="Closed", search="server") == 0
+
+
+@pytest.mark.parametrize("column", ["status", "created_at"])
+def test_sort_by_column(seeded, column):
+    values = [getattr(t, column) for t in seeded.list_tickets(sort_by=column)]
+    assert values == sorted(values)
+
+
+def test_sort_by_priority_rank_with_id_tiebreak(seeded):
+    result = [(t.priority, t.id) for t in seeded.list_tickets(sort_by="priority")]
+    assert [p for p, _ in result] == ["High", "High", "Medium", "Low", "Low"]
+    assert result == sorted(result, key=lambda r: (PRIORITY_RANKS[r[0]], r[1]))
+
+    desc = [
+        (t.priority, t.id)
+        for t in seeded.list_tickets(sort_by="priority", sort_dir="desc")
+    ]
+    assert desc == list(reversed(result))
+
+
+def test_priority_pagination_is_stable(seeded):
+    full = [t.id for t in seeded.list_tickets(sort_by="priority", limit=100)]
+    paged = [
+        t.id
+        for offset in range(0, 5, 2)
+        for t in seeded.list_tickets(sort_by="priority", offset=offset, limit=2)
+    ]
+    assert paged == full
+
+
+def test_filtered_priority_sort_both_directions(seeded):
+    asc = [t.id for t in seeded.list_tickets(filter_status="Open", sort_by="priority")]
+    desc = [
+        t.id
+        for t in seeded.list_tickets(
+            filter_status="Open", sort_by="priority", sort_dir="desc"
+        )
+    ]
+    assert asc == [2, 4, 3, 1, 5]
+    assert desc == list(reversed(asc))
+
+
+@pytest.mark.parametrize(
+    "search, expected",
+    [
+        ("_", ["snake_case cron"]),
+        ("%", ["Disk 100% full"]),
+        ("\\", ["Path C:\\temp"]),
+        ("DISK", ["Disk 100% full"]),
+        ("Ärger", ["Ärger mit VPN"]),
+        ("ärger", []),  # LIKE folds ASCII case only
+    ],
+)
+def test_search_matches_literally_on_every_backend(backend, search, expected):
+    backend.create_ticket("snake_case cron", "Job named nightly", "Low")
+    backend.create_ticket("Disk 100% full", "Volume is out of space", "High")
+    backend.create_ticket("Path C:\\temp", "Backslash in a path", "Low")
+    backend.create_ticket("Ärger mit VPN", "Tunnel drops hourly", "Medium")
+    assert [t.title for t in backend.list_tickets(search=search)] == expected
+    assert backend.count_tickets(search=search) == len(expected)
+
+
+def test_sort_with_filter_and_search(seeded):
+    seeded.create_ticket("Server fan", "Server fan noisy", "Low")
+    result = seeded.list_tickets(
+        filter_status="Open", sort_by="priority", search="server"
+    )
+    assert sorted(t.title for t in result) == [
+        "Email bounce",
+        "Server down",
+        "Server fan",
+    ]
+    priorities = [t.priority for t in result]
+    assert priorities == sorted(priorities)
+
+
+def test_index_follows_updates(seeded):
+    for t in seeded.list_tickets(limit=100):
+        seeded.update_ticket(
+            t.id, t.title, "Reassigned ticket", "Medium", "In Progress"
+        )
+    assert seeded.count_tickets(filter_status="Open") == 0
+    assert seeded.count_tickets(filter_status="In Progress") == 5
+    assert {t.priority for t in seeded.list_tickets(sort_by="priority")} == {"Medium"}
+
+
+def test_list_returns_bounded_preview_not_full_body(backend):
+    long_text = "x" * (DESCRIPTION_PREVIEW_LENGTH * 5)
+    tid = backend.create_ticket("Long one", long_text, "Low")
+    (row,) = backend.list_tickets()
+    assert not hasattr(row, "description")
+    assert row.description_preview == long_text[:DESCRIPTION_PREVIEW_LENGTH]
+    assert backend.get_ticket(tid).description == long_text
+
+
+def test_sqlite_priority_sort_walks_index():
+    backend = _sqlite_backend()
+    plans = [
+        " ".join(row[-1] for row in backend.conn.execute(f"EXPLAIN QUERY PLAN {sql}"))
+        for sql in (
+            "SELECT * FROM tickets ORDER BY priority_rank, id LIMIT 10",
+            "SELECT * FROM tickets ORDER BY priority_rank DESC, id DESC LIMIT 10",
+            "SELECT * FROM tickets WHERE status='Open' ORDER BY priority_rank, id",
+        )
+    ]
+    for plan in plans:
+        assert "USING INDEX idx_tickets_" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+def test_priority_rank_added_to_existing_database(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "old.db"))
+    conn.execute(
+        "CREATE TABLE tickets (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL,"
+        " description TEXT NOT NULL, priority TEXT NOT NULL,"
+        " status TEXT NOT NULL DEFAULT 'Open',"
+        " created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,"
+        " updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+    )
+    conn.execute(
+        "INSERT INTO tickets (title, description, priority) VALUES ('a', 'b', 'Low')"
+    )
+    conn.execute(
+        "INSERT INTO tickets (title, description, priority) VALUES ('c', 'd', 'High')"
+    )
+    conn.commit()
+    conn.row_factory = sqlite3.Row
+    setup_db(conn)
+    setup_db(conn)  # idempotent
+    titles = [t.title for t in SQLiteBackend(conn).list_tickets(sort_by="priority")]
+    assert titles == ["c", "a"]
+
+
+def test_claim_next_ticket_order(seeded):
+    closed = seeded.create_ticket("Closed high", "Already handled", "High")
+    seeded.update_ticket(closed, "Closed high", "Already handled", "High", "Closed")
+
+    claimed = [seeded.claim_next_ticket("alice", 600) for _ in range(6)]
+    assert [t.title for t in claimed[:5]] == [
+        "Server down",
+        "Email bounce",
+        "VPN slow",
+        "Printer jam",
+        "New laptop",
+    ]
+    assert claimed[5] is None
+    assert all(t.assignee == "alice" and t.lease_expires_at for t in claimed[:5])
+
+
+def test_expired_lease_returns_ticket_to_queue(backend):
+    tid = backend.create_ticket("Server down", "Main server is down", "High")
+    assert backend.claim_next_ticket("alice", -1).id == tid
+    reclaimed = backend.claim_next_ticket("bob", 600)
+    assert (reclaimed.id, reclaimed.assignee) == (tid, "bob")
+    assert backend.claim_next_ticket("carol", 600) is None
+
+
+def test_release_ticket(backend):
+    tid = backend.create_ticket("Server down", "Main server is down", "High")
+    backend.claim_next_ticket("alice", 600)
+    assert backend.release_ticket(tid, "bob") == 0
+    assert backend.release_ticket(tid, "alice") == 1
+    assert backend.claim_next_ticket("bob", 600).id == tid
+
+
+def test_generation_moves_on_every_write_only(backend):
+    seen = [backend.generation()]
+
+    def bumped():
+        seen.append(backend.generation())
+        return seen[-1] != seen[-2]
+
+    tid = backend.create_ticket("Server down", "Main server is down", "High")
+    assert bumped()
+    backend.get_ticket(tid)
+    backend.list_tickets()
+    backend.count_tickets()
+    assert not bumped()
+    backend.update_ticket(tid, "Server down", "Still down", "High", "Open")
+    assert bumped()
+    backend.claim_next_ticket("alice", 600)
+    assert bumped()
+    backend.release_ticket(tid, "alice")
+    assert bumped()
+    backend.escalate_ticket(tid, ["Open"])
+    assert bumped()
+    assert backend.delete_ticket(tid + 1) == 0
+    assert not bumped()
+    backend.delete_ticket(tid)
+    assert bumped()
+
+
+def test_suggest_titles_by_word_prefix(seeded):
+    assert seeded.suggest_titles("ser") == [(2, "Server down")]
+    assert seeded.suggest_titles("E") == [(4, "Email bounce")]
+    assert seeded.suggest_titles("server d") == [(2, "Server down")]
+    assert seeded.suggest_titles("own") == []
+    assert seeded.suggest_titles("  ") == []
+    seeded.create_ticket("Server rack", "Rack power", "Low")
+    assert [tid for tid, _ in seeded.suggest_titles("serv")] == [6, 2]
+    assert seeded.suggest_titles("serv", limit=1) == [(6, "Server rack")]
+
+
+def test_suggest_titles_follows_writes(seeded):
+    seeded.update_ticket(2, "Database down", "Main DB is down", "High", "Open")
+    assert seeded.suggest_titles("server") == []
+    assert seeded.suggest_titles("data") == [(2, "Database down")]
+    seeded.delete_ticket(2)
+    assert seeded.suggest_titles("data") == []
+
+
+def test_title_index_built_for_existing_database(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE tickets (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL,"
+        " description TEXT NOT NULL, priority TEXT NOT NULL,"
+        " status TEXT NOT NULL DEFAULT 'Open',"
+        " created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,"
+        " updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+    )
+    conn.execute(
+        "INSERT INTO tickets (title, description, priority) VALUES ('VPN down', 'x', 'High')"
+    )
+    conn.commit()
+    setup_db(conn)
+    assert SQLiteBackend(conn).suggest_titles("vp") == [(1, "VPN down")]
+
+
+def test_concurrent_claimers_never_share_a_ticket(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from database import get_connection
+
+    path = str(tmp_path / "queue.db")
+    seed = SQLiteBackend(get_connection(path))
+    setup_db(seed.conn)
+    for i in range(60):
+        seed.create_ticket(f"T{i}", "Queued ticket", ["Low", "Medium", "High"][i % 3])
+
+    def claimer(n):
+        backend = SQLiteBackend(get_connection(path))
+        try:
+            return [
+                t.id
+                for t in iter(lambda: backend.claim_next_ticket(f"a{n}", 600), None)
+            ]
+        finally:
+            backend.close()
+
+    with ThreadPoolExecutor(max_workers=24) as pool:
+        results = list(pool.map(claimer, range(24)))
+    claimed = [tid for ids in results for tid in ids]
+    assert len(claimed) == len(set(claimed)) == 60
+    seed.close()
+
+
+def test_sqlite_claim_walks_index():
+    from models.ticket import CLAIMABLE_SQL
+
+    backend = _sqlite_backend()
+    plan = " ".join(
+        row[-1] for row in backend.conn.execute(f"EXPLAIN QUERY PLAN {CLAIMABLE_SQL}")
+    )
+    assert "USING INDEX idx_tickets_status_priority_rank" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def _sqlite_backend_without_fts():
+    backend = _sqlite_backend()
+    for event in ("insert", "delete", "update"):
+        backend.conn.execute(f"DROP TRIGGER tickets_title_fts_{event}")
+    backend.conn.execute("DROP TABLE tickets_title_fts")
+    return backend
+
+
+@pytest.mark.parametrize(
+    "prefix", ["own", "down", "d", "vpn d", "ÄRG", "mail ärger", "der", "%", "_"]
+)
+def test_suggest_fallback_matches_fts(prefix):
+    results = []
+    for factory in (_sqlite_backend, _sqlite_backend_without_fts, MemoryBackend):
+        backend = factory()
+        for title in ("Server down", "VPN-down again", "Ärger mit Mail", "Undersized"):
+            backend.create_ticket(title, "Needs attention", "Low")
+        results.append(backend.suggest_titles(prefix))
+        backend.close()
+    assert results[0] == results[1] == results[2]
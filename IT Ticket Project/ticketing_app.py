@@ -1,17 +1,32 @@
 import os
 
-from config import SECRET_KEY
+import config
+from admission import init_admission
 from database import close_db
 from flask import Flask
+from fragments import init_fragments
+from http_cache import init_http_cache
+from maintenance import init_maintenance
+from profiling import init_profiling
 from routes.tickets import bp as tickets_bp
+from sla import init_sla_scheduler
 
 
-def create_app():
+def create_app(test_config=None):
     app = Flask(__name__)
-    app.secret_key = SECRET_KEY
+    app.config.from_object(config)
+    if test_config:
+        app.config.update(test_config)
 
     app.register_blueprint(tickets_bp)
     app.teardown_appcontext(close_db)
+    init_fragments(app)
+    init_http_cache(app)
+    init_profiling(app)
+    init_sla_scheduler(app)
+    init_maintenance(app)
+    # Outermost, so shed requests cost nothing (not even profiling)
+    init_admission(app)
 
     return app
 
@@ -16,3 +16,31 @@ def validate_ticket(
         errors.append("Invalid status selected.")
 
     return errors
+
+
+# A claim lease longer than this is almost certainly a mistake
+MAX_LEASE_SECONDS = 7 * 24 * 3600
+
+
+def validate_assignee(assignee):
+    errors = []
+
+    if not assignee or len(assignee) > 100:
+        errors.append("Assignee must be between 1 and 100 characters.")
+
+    return errors
+
+
+def validate_lease_seconds(lease_seconds, max_seconds=MAX_LEASE_SECONDS):
+    errors = []
+
+    if (
+        not isinstance(lease_seconds, int)
+        or isinstance(lease_seconds, bool)
+        or not 0 < lease_seconds <= max_seconds
+    ):
+        errors.append(
+            f"Lease must be a whole number of seconds between 1 and {max_seconds}."
+        )
+
+    return errors